@@ -3,14 +3,81 @@ EDA AI Benchmarking Framework
 Automated evaluation pipeline for generative AI models in HDL design
 """
 
+import asyncio
+import copy
+import hashlib
 import json
+import os
+import shutil
 import subprocess
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
 import re
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Bump when EvaluationMetrics fields change so stale metrics caches are dropped
+_METRICS_CACHE_VERSION = 1
+
+
+def _json_bytes(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _resolve_tool(name: str) -> str:
+    """Absolute path of an EDA tool, resolved once instead of per spawn
+
+    Falls back to the bare name so a missing tool still raises
+    FileNotFoundError at call time.
+    """
+    return shutil.which(name) or name
+
+# EDA tool subprocesses are spawned with close_fds=False and no preexec_fn so
+# CPython can use posix_spawn/vfork instead of fork+exec. Pipes created by
+# subprocess are non-inheritable (PEP 446), so concurrent spawns don't leak
+# each other's descriptors.
+
+# Simulation result patterns: (compiled regex, group 2 is a FAILED count)
+_SIM_PATTERNS = [
+    (re.compile(r'(\d+)/(\d+) tests passed'), False),
+    (re.compile(r'PASSED: (\d+), FAILED: (\d+)'), True),
+    (re.compile(r'Tests passed: (\d+) out of (\d+)'), False),
+]
+_CELL_RE = re.compile(r'Number of cells:\s+(\d+)')
+_DUT_RE = re.compile(r'\s+(\w+)\s+(\w+)\s*\(')
+_DUT_NAME_RE = re.compile(r'dut', re.IGNORECASE)
+_VCD_HAS_RE = re.compile(r'\$dumpvars|\$dumpfile')
+# Testbench lines scanned for $dumpvars before falling back to a full read
+_TB_HEADER_LINES = 500
+_TASK_MARKER_RE = re.compile(r'^===TASK:(\d+|END)===\s*$', re.MULTILINE)
+
+# Yosys synthesis passes applied to each design
+_SYNTH_PASSES = """hierarchy -auto-top
+proc; opt; fsm; opt; memory; opt
+techmap; opt
+stat
+"""
+
 @dataclass
 class BenchmarkTask:
     """Represents a single HDL design task"""
@@ -60,6 +127,8 @@ class EvaluationMetrics:
     semantic_repair_applied: List[str] = None
     # Fast-path diagnostics (Phase 4 scaling)
     fast_skip_reason: Optional[str] = None
+    # True when generated code was served from the generation cache
+    cache_hit: bool = False
     
     def __post_init__(self):
         """Initialize default values for optional fields"""
@@ -67,37 +136,101 @@ class EvaluationMetrics:
             self.semantic_repair_applied = []
     
     def to_dict(self):
-        return asdict(self)
+        # Fields are scalars apart from two lists of strings, so a shallow
+        # copy of those lists is equivalent to asdict() without its deepcopy
+        return {
+            **self.__dict__,
+            "compile_errors": list(self.compile_errors),
+            "semantic_repair_applied": list(self.semantic_repair_applied),
+        }
+
+# Columnar schema for benchmark_results.parquet (mirrors EvaluationMetrics)
+if PYARROW_AVAILABLE:
+    _RESULTS_SCHEMA = pa.schema([
+        ("task_id", pa.string()),
+        ("model_name", pa.dictionary(pa.int16(), pa.string())),
+        ("syntax_valid", pa.bool_()),
+        ("compile_errors", pa.list_(pa.string())),
+        ("simulation_passed", pa.bool_()),
+        ("test_cases_passed", pa.int32()),
+        ("test_cases_total", pa.int32()),
+        ("gate_count", pa.int64()),
+        ("cell_count", pa.int64()),
+        ("estimated_area", pa.float64()),
+        ("generation_time", pa.float64()),
+        ("compile_time", pa.float64()),
+        ("simulation_time", pa.float64()),
+        ("tb_generated", pa.bool_()),
+        ("fault_detection_ratio", pa.float64()),
+        ("iteration_count", pa.int32()),
+        ("confidence_log_prob", pa.float64()),
+        ("confidence_entropy", pa.float64()),
+        ("waveform_diff_summary", pa.string()),
+        ("formal_equiv_status", pa.dictionary(pa.int8(), pa.string())),
+        ("semantic_repair_applied", pa.list_(pa.string())),
+        ("fast_skip_reason", pa.dictionary(pa.int8(), pa.string())),
+        ("cache_hit", pa.bool_()),
+    ])
 
 class HDLCompiler:
-    """Handles HDL compilation using Verilator or Icarus Verilog"""
+    """
+    Handles HDL compilation using Verilator or Icarus Verilog
     
-    def __init__(self, tool="verilator"):
+    Verilator runs in --lint-only mode by default. With lint_only=False it
+    performs a full C++ build, tuned with:
+      - jobs: parallel make jobs (-j, MAKEFLAGS, VM_PARALLEL_BUILDS)
+      - opt_level: Verilator optimization level passed at verilation
+      - split: --output-split size so large designs compile in parallel
+    """
+    
+    def __init__(
+        self,
+        tool="verilator",
+        lint_only: bool = True,
+        jobs: Optional[int] = None,
+        opt_level: str = "-O3",
+        split: int = 5000
+    ):
         self.tool = tool
+        self.lint_only = lint_only
+        self.jobs = jobs or min(os.cpu_count() or 1, 4)
+        self.opt_level = opt_level
+        self.split = split
+        self.verilator = _resolve_tool("verilator")
+        self.iverilog = _resolve_tool("iverilog")
+    
+    def _verilator_build_cmd(self, hdl_file: Path, output_dir: Path) -> List[str]:
+        """Build argv for a full, parallel Verilator C++ build"""
+        return [
+            self.verilator, "--cc", self.opt_level,
+            "--output-split", str(self.split),
+            "--output-split-cfuncs", str(self.split // 10),
+            "-CFLAGS", "-O1 -fstrict-aliasing",
+            "--Mdir", str(output_dir / "obj_dir"),
+            "--build", "-j", str(self.jobs),
+            str(hdl_file)
+        ]
         
     def compile(self, hdl_file: Path, output_dir: Path) -> tuple[bool, List[str]]:
         """
         Compile HDL file and return success status and errors
         """
-        errors = []
+        env = None
+        if self.tool == "verilator" and self.lint_only:
+            argv, timeout = [self.verilator, "--lint-only", str(hdl_file)], 30
+        elif self.tool == "verilator":
+            argv, timeout = self._verilator_build_cmd(hdl_file, output_dir), 300
+            env = {
+                **os.environ,
+                "MAKEFLAGS": f"-j{self.jobs}",
+                "VM_PARALLEL_BUILDS": "1"
+            }
+        else:  # iverilog
+            argv, timeout = [self.iverilog, "-t", "null", str(hdl_file)], 30
+        
         try:
-            if self.tool == "verilator":
-                result = subprocess.run(
-                    ["verilator", "--lint-only", str(hdl_file)],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-            else:  # iverilog
-                result = subprocess.run(
-                    ["iverilog", "-t", "null", str(hdl_file)],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-            
-            if result.returncode != 0:
-                errors = self._parse_errors(result.stderr)
+            returncode, errors = self._run_collecting_errors(argv, timeout, env)
+            if returncode != 0:
                 return False, errors
             return True, []
             
@@ -108,15 +241,71 @@ class HDLCompiler:
         except Exception as e:
             return False, [str(e)]
     
-    def _parse_errors(self, stderr: str) -> List[str]:
-        """Extract meaningful error messages"""
-        lines = stderr.split('\n')
-        errors = [line.strip() for line in lines if 'Error' in line or 'error' in line]
-        return errors[:5]  # Limit to first 5 errors
+    def _run_collecting_errors(
+        self,
+        argv: List[str],
+        timeout: float,
+        env: Optional[Dict[str, str]] = None,
+        max_errors: int = 5
+    ) -> Tuple[int, List[str]]:
+        """
+        Run a tool, reading stderr line by line for error messages
+        
+        Stops reading and terminates the tool once max_errors error lines are
+        seen, so a tool that dumps megabytes of diagnostics costs bounded
+        memory and CPU.
+        
+        Returns:
+            Tuple of (returncode, first max_errors error lines)
+        
+        Raises:
+            subprocess.TimeoutExpired: If the tool runs longer than timeout
+        """
+        proc = subprocess.Popen(
+            argv,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            close_fds=False,
+            env=env
+        )
+        timed_out = threading.Event()
+        
+        def _kill():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
+        errors = []
+        try:
+            for line in proc.stderr:
+                if 'Error' in line or 'error' in line:
+                    errors.append(line.strip())
+                    if len(errors) >= max_errors:
+                        proc.terminate()
+                        break
+            try:
+                returncode = proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                returncode = proc.wait()
+        finally:
+            timer.cancel()
+            proc.stderr.close()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(argv, timeout)
+        return returncode, errors
 
 class HDLSimulator:
     """Runs simulation and compares outputs"""
     
+    def __init__(self):
+        self.iverilog = _resolve_tool("iverilog")
+        self.vvp = _resolve_tool("vvp")
+    
     def simulate(
         self, 
         hdl_file: Path, 
@@ -141,22 +330,29 @@ class HDLSimulator:
             # Use testbench with VCD if requested
             tb_to_use = testbench
             if generate_vcd:
-                # Check if testbench already has $dumpvars
-                tb_content = testbench.read_text()
-                if "$dumpvars" not in tb_content and "$dumpfile" not in tb_content:
+                # Check if testbench already has $dumpvars; dump setup sits
+                # near the top, so only read the rest when the header lacks it
+                with testbench.open("r") as f:
+                    header = "".join(islice(f, _TB_HEADER_LINES))
+                    has_dump = bool(_VCD_HAS_RE.search(header))
+                    if not has_dump:
+                        rest = f.read()
+                        has_dump = bool(_VCD_HAS_RE.search(rest))
+                if not has_dump:
                     # Inject VCD dump
                     tb_with_vcd = output_dir / "testbench_with_vcd.v"
-                    modified_content = self._inject_vcd_dump(tb_content)
+                    modified_content = self._inject_vcd_dump(header + rest, header)
                     tb_with_vcd.write_text(modified_content)
                     tb_to_use = tb_with_vcd
             
             # Compile with testbench
             compile_result = subprocess.run(
-                ["iverilog", "-o", str(output_dir / "sim.vvp"), 
+                [self.iverilog, "-o", str(output_dir / "sim.vvp"), 
                  str(hdl_file), str(tb_to_use)],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=30,
+                close_fds=False
             )
             
             if compile_result.returncode != 0:
@@ -164,10 +360,11 @@ class HDLSimulator:
             
             # Run simulation
             sim_result = subprocess.run(
-                ["vvp", str(output_dir / "sim.vvp")],
+                [self.vvp, str(output_dir / "sim.vvp")],
                 capture_output=True,
                 text=True,
                 timeout=30,
+                close_fds=False,
                 cwd=str(output_dir)
             )
             
@@ -190,15 +387,23 @@ class HDLSimulator:
             print(f"Simulation error: {e}")
             return False, 0, 0, None
     
-    def _inject_vcd_dump(self, tb_content: str) -> str:
-        """Inject $dumpvars into testbench content"""
-        # Try to find module instantiation (usually "dut")
-        if "dut" in tb_content.lower():
+    def _inject_vcd_dump(self, tb_content: str, header: Optional[str] = None) -> str:
+        """Inject $dumpvars into testbench content
+        
+        Args:
+            tb_content: Full testbench source
+            header: Leading lines searched first for the DUT instantiation
+        """
+        # Try to find module instantiation (usually "dut"), in the header
+        # first and the full source only if it misses
+        search_in = [header, tb_content] if header else [tb_content]
+        if any(_DUT_NAME_RE.search(text) for text in search_in):
             dut_name = "dut"
         else:
             # Try to find first module instantiation
-            import re
-            match = re.search(r'\s+(\w+)\s+(\w+)\s*\(', tb_content)
+            match = next(
+                (m for m in map(_DUT_RE.search, search_in) if m), None
+            )
             if match:
                 dut_name = match.group(2)
             else:
@@ -225,16 +430,10 @@ class HDLSimulator:
     def _parse_simulation_output(self, output: str) -> tuple[int, int]:
         """Parse test results from simulation output"""
         # Look for common test result patterns
-        patterns = [
-            r'(\d+)/(\d+) tests passed',
-            r'PASSED: (\d+), FAILED: (\d+)',
-            r'Tests passed: (\d+) out of (\d+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, output)
+        for pattern, counts_failed in _SIM_PATTERNS:
+            match = pattern.search(output)
             if match:
-                if 'FAILED' in pattern:
+                if counts_failed:
                     passed = int(match.group(1))
                     failed = int(match.group(2))
                     return passed, passed + failed
@@ -249,6 +448,9 @@ class HDLSimulator:
 class SynthesisTool:
     """Handles synthesis using Yosys"""
     
+    def __init__(self):
+        self.yosys = _resolve_tool("yosys")
+    
     def synthesize(self, hdl_file: Path, output_dir: Path) -> Dict:
         """
         Synthesize HDL and extract metrics
@@ -256,22 +458,17 @@ class SynthesisTool:
         """
         try:
             # Create Yosys script
-            script = f"""
-read_verilog {hdl_file}
-hierarchy -auto-top
-proc; opt; fsm; opt; memory; opt
-techmap; opt
-stat
-"""
+            script = f"\nread_verilog {hdl_file}\n{_SYNTH_PASSES}"
             script_file = output_dir / "synth.ys"
             script_file.write_text(script)
             
             # Run Yosys
             result = subprocess.run(
-                ["yosys", "-s", str(script_file)],
+                [self.yosys, "-s", str(script_file)],
                 capture_output=True,
                 text=True,
-                timeout=60
+                timeout=60,
+                close_fds=False
             )
             
             return self._parse_synthesis_stats(result.stdout)
@@ -280,6 +477,63 @@ stat
             print(f"Synthesis error: {e}")
             return {"gate_count": None, "cell_count": None, "estimated_area": None}
     
+    def synthesize_batch(self, hdl_files: List[Path], output_dir: Path) -> List[Dict]:
+        """
+        Synthesize many designs in a single Yosys process
+        
+        Each design runs in its own `design -reset` block delimited by log
+        markers, so Yosys startup is paid once per batch. A Yosys error aborts
+        the remainder of a script, so designs after a failing one are retried
+        in a fresh batch.
+        
+        Returns:
+            List of stats dicts, in the same order as hdl_files
+        """
+        if not hdl_files:
+            return []
+        
+        blocks = [
+            f"design -reset\nlog ===TASK:{i}===\nread_verilog {hdl_file}\n{_SYNTH_PASSES}"
+            for i, hdl_file in enumerate(hdl_files)
+        ]
+        script = "\n".join(blocks) + "log ===TASK:END===\n"
+        
+        try:
+            script_file = output_dir / "synth_batch.ys"
+            script_file.write_text(script)
+            result = subprocess.run(
+                [self.yosys, "-s", str(script_file)],
+                capture_output=True,
+                text=True,
+                timeout=60 * len(hdl_files),
+                close_fds=False
+            )
+            output = result.stdout
+        except Exception as e:
+            print(f"Synthesis error: {e}")
+            return [
+                {"gate_count": None, "cell_count": None, "estimated_area": None}
+                for _ in hdl_files
+            ]
+        
+        # Split stdout into per-design chunks on the markers
+        markers = list(_TASK_MARKER_RE.finditer(output))
+        chunks: Dict[int, str] = {}
+        for marker, next_marker in zip(markers, markers[1:] + [None]):
+            if marker.group(1) == "END":
+                continue
+            end = next_marker.start() if next_marker else len(output)
+            chunks[int(marker.group(1))] = output[marker.end():end]
+        
+        if not chunks:
+            # Yosys never reached the first design; synthesize one at a time
+            return [self.synthesize(f, output_dir) for f in hdl_files]
+        
+        stats = [self._parse_synthesis_stats(chunks[i]) for i in sorted(chunks)]
+        if len(stats) < len(hdl_files):
+            stats.extend(self.synthesize_batch(hdl_files[len(stats):], output_dir))
+        return stats
+    
     def _parse_synthesis_stats(self, output: str) -> Dict:
         """Extract synthesis statistics"""
         stats = {
@@ -289,7 +543,7 @@ stat
         }
         
         # Parse Yosys stat output
-        cell_match = re.search(r'Number of cells:\s+(\d+)', output)
+        cell_match = _CELL_RE.search(output)
         if cell_match:
             stats["cell_count"] = int(cell_match.group(1))
             stats["gate_count"] = stats["cell_count"]  # Approximate
@@ -352,10 +606,71 @@ Verilog code:
     end
 endmodule"""
 
+class GenerationCache:
+    """
+    Bounded LRU memo of model generations keyed by (model_name, spec digest)
+    
+    Specs are keyed by a BLAKE2b digest rather than the raw text to bound
+    memory. The cache can be persisted to JSON for reuse across runs.
+    """
+    
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def spec_digest(spec: str) -> str:
+        return hashlib.blake2b(spec.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, model_name: str, spec: str) -> Optional[str]:
+        key = (model_name, self.spec_digest(spec))
+        with self._lock:
+            code = self._entries.get(key)
+            if code is not None:
+                self._entries.move_to_end(key)
+            return code
+    
+    def put(self, model_name: str, spec: str, code: str):
+        key = (model_name, self.spec_digest(spec))
+        with self._lock:
+            self._entries[key] = code
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def load(self, cache_file: Path):
+        """Load persisted entries (missing or corrupt files are ignored)"""
+        try:
+            entries = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            return
+        for model_name, digest, code in entries[-self.maxsize:]:
+            self._entries[(model_name, digest)] = code
+    
+    def save(self, cache_file: Path):
+        with self._lock:
+            entries = [[m, d, code] for (m, d), code in self._entries.items()]
+        # Write-then-rename so an interrupted save never truncates the cache
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        tmp_file.write_text(json.dumps(entries))
+        os.replace(tmp_file, cache_file)
+
+
 class BenchmarkPipeline:
     """Main benchmarking pipeline orchestrator"""
     
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, max_concurrent: Optional[int] = None):
+        """
+        Args:
+            output_dir: Directory for per-task artifacts and results
+            max_concurrent: Maximum (task, model) evaluations in flight at once
+                            during run_benchmark (defaults to min(cpu_count, 4))
+        """
         self.output_dir = output_dir
         self.output_dir.mkdir(exist_ok=True)
         
@@ -363,24 +678,97 @@ class BenchmarkPipeline:
         self.simulator = HDLSimulator()
         self.synthesizer = SynthesisTool()
         
+        if max_concurrent is None:
+            max_concurrent = min(os.cpu_count() or 1, 4)
+        self.max_concurrent = max(1, max_concurrent)
+        
+        # Memoized generations, persisted across runs
+        self.generation_cache = GenerationCache()
+        self.generation_cache_file = self.output_dir / ".gen_cache.json"
+        self.generation_cache.load(self.generation_cache_file)
+        
+        # Metrics memoized by fingerprint of (generated HDL, reference testbench),
+        # persisted as plain JSON records so the cache does not depend on
+        # how EvaluationMetrics was imported or which version defined it
+        self.metrics_cache_file = self.output_dir / "metrics_cache.json"
+        self._metrics_cache: Dict[bytes, EvaluationMetrics] = self._load_metrics_cache()
+        
         self.results = []
+        self._results_lock = threading.Lock()
+        # Per-task NDJSON stream (opened on first evaluated task) so partial
+        # results survive an interrupted sweep
+        self.results_stream_file = self.output_dir / "benchmark_results.ndjson"
+        self._results_fh = None
+        
+        # Designs awaiting one batched Yosys run (see synthesize_pending)
+        self._pending_synthesis: List[Tuple[EvaluationMetrics, Path]] = []
+        self._pending_files: Dict[bytes, Path] = {}
     
-    def evaluate_task(self, task: BenchmarkTask, model: AIModelInterface) -> EvaluationMetrics:
+    def evaluate_task(
+        self,
+        task: BenchmarkTask,
+        model: AIModelInterface,
+        run_synthesis: bool = True
+    ) -> EvaluationMetrics:
         """
         Run complete evaluation pipeline for a single task
+        
+        Args:
+            task: Benchmark task to evaluate
+            model: Model used to generate the HDL
+            run_synthesis: Synthesize immediately; when False, syntax-valid
+                           designs are queued for synthesize_pending()
         """
         print(f"Evaluating task: {task.task_id}")
         
-        # Create task-specific directory
-        task_dir = self.output_dir / task.task_id
+        # Create task-specific directory (per model, so concurrent
+        # evaluations of the same task never share build artifacts); HF ids
+        # like "org/model" must not become nested paths
+        model_slug = re.sub(r'[^\w.]+', '_', model.model_name)
+        task_dir = self.output_dir / f"{model_slug}_{task.task_id}"
         task_dir.mkdir(exist_ok=True)
         
-        # Generate HDL
-        generated_code, gen_time = model.generate_hdl(task.spec)
+        # Generate HDL (memoized on model name + spec)
+        generated_code = self.generation_cache.get(model.model_name, task.spec)
+        cache_hit = generated_code is not None
+        if cache_hit:
+            gen_time = 0.0
+        else:
+            generated_code, gen_time = model.generate_hdl(task.spec)
+            self.generation_cache.put(model.model_name, task.spec, generated_code)
+        
+        # Reuse prior metrics when this exact HDL was already evaluated
+        # against the same testbench
+        fingerprint = self._fingerprint(generated_code, task)
+        cached_metrics = self._metrics_cache.get(fingerprint) if fingerprint else None
+        if cached_metrics is not None:
+            metrics = copy.deepcopy(cached_metrics)
+            metrics.task_id = task.task_id
+            metrics.model_name = model.model_name
+            metrics.generation_time = gen_time
+            metrics.cache_hit = cache_hit
+            metrics.fast_skip_reason = "cache_hit"
+            with self._results_lock:
+                source_file = self._pending_files.get(fingerprint)
+                if source_file is not None:
+                    self._pending_synthesis.append((metrics, source_file))
+            self._record_result(metrics)
+            return metrics
+        
+        # Same HDL as this task directory's last evaluation (e.g. a rerun
+        # with a warm generation cache): reload its sidecar metrics
+        stored_metrics = self._load_sidecar(task_dir, fingerprint)
+        if stored_metrics is not None:
+            stored_metrics.generation_time = gen_time
+            stored_metrics.cache_hit = cache_hit
+            stored_metrics.fast_skip_reason = "cache_hit"
+            self._metrics_cache[fingerprint] = stored_metrics
+            self._record_result(stored_metrics)
+            return stored_metrics
         
         # Save generated code
         hdl_file = task_dir / f"{task.task_id}.v"
-        hdl_file.write_text(generated_code)
+        hdl_file.write_bytes(generated_code.encode("utf-8"))
         
         # Syntax validation
         compile_start = time.time()
@@ -395,14 +783,14 @@ class BenchmarkPipeline:
         
         if syntax_valid and task.reference_tb:
             sim_start = time.time()
-            sim_passed, tests_passed, tests_total = self.simulator.simulate(
+            sim_passed, tests_passed, tests_total, _ = self.simulator.simulate(
                 hdl_file, Path(task.reference_tb), task_dir
             )
             sim_time = time.time() - sim_start
         
         # Synthesis (if functionally correct)
         synth_stats = {"gate_count": None, "cell_count": None, "estimated_area": None}
-        if syntax_valid:
+        if syntax_valid and run_synthesis:
             synth_stats = self.synthesizer.synthesize(hdl_file, task_dir)
         
         # Create metrics object
@@ -421,33 +809,220 @@ class BenchmarkPipeline:
             compile_time=compile_time,
             simulation_time=sim_time,
             tb_generated=False,
-            fault_detection_ratio=None
+            fault_detection_ratio=None,
+            cache_hit=cache_hit
         )
         
-        self.results.append(metrics)
+        if syntax_valid and not run_synthesis:
+            with self._results_lock:
+                self._pending_synthesis.append((metrics, hdl_file))
+                if fingerprint:
+                    self._pending_files[fingerprint] = hdl_file
+        
+        if fingerprint:
+            self._metrics_cache[fingerprint] = metrics
+            self._write_sidecar(task_dir, fingerprint, metrics)
+        self._record_result(metrics)
         return metrics
     
-    def run_benchmark(self, tasks: List[BenchmarkTask], models: List[AIModelInterface]):
+    def _load_metrics_cache(self) -> Dict[bytes, EvaluationMetrics]:
+        """Persisted metrics cache, or empty if missing, stale or unreadable"""
+        try:
+            data = json.loads(self.metrics_cache_file.read_bytes())
+            if data.get("version") != _METRICS_CACHE_VERSION:
+                return {}
+            return {
+                bytes.fromhex(key): EvaluationMetrics(**record)
+                for key, record in data["entries"].items()
+            }
+        except Exception:
+            # Any corrupt or incompatible cache is discarded, never fatal
+            return {}
+    
+    def _save_metrics_cache(self):
+        """Atomically write the metrics cache as versioned JSON records"""
+        payload = {
+            "version": _METRICS_CACHE_VERSION,
+            "entries": {key.hex(): m.to_dict() for key, m in self._metrics_cache.items()},
+        }
+        tmp = self.metrics_cache_file.with_name(self.metrics_cache_file.name + ".tmp")
+        tmp.write_bytes(_json_bytes(payload))
+        os.replace(tmp, self.metrics_cache_file)
+    
+    def _load_sidecar(self, task_dir: Path, fingerprint: Optional[bytes]) -> Optional[EvaluationMetrics]:
+        """Metrics stored in task_dir if its .digest matches fingerprint"""
+        if not fingerprint:
+            return None
+        try:
+            if (task_dir / ".digest").read_text() != fingerprint.hex():
+                return None
+            return EvaluationMetrics(**json.loads((task_dir / ".metrics.json").read_bytes()))
+        except (OSError, ValueError, TypeError):
+            return None
+    
+    def _write_sidecar(self, task_dir: Path, fingerprint: bytes, metrics: EvaluationMetrics):
+        """Atomically store the HDL fingerprint and its metrics in task_dir"""
+        for name, data in (
+            (".metrics.json", _json_bytes(metrics.to_dict())),
+            (".digest", fingerprint.hex().encode("ascii")),
+        ):
+            tmp = task_dir / f"{name}.tmp"
+            tmp.write_bytes(data)
+            os.replace(tmp, task_dir / name)
+    
+    def synthesize_pending(self):
+        """Synthesize all queued designs in one Yosys run and fill in their stats"""
+        with self._results_lock:
+            pending = self._pending_synthesis
+            self._pending_synthesis = []
+            self._pending_files = {}
+        if not pending:
+            return
+        
+        hdl_files = list(dict.fromkeys(hdl_file for _, hdl_file in pending))
+        print(f"Synthesizing {len(hdl_files)} designs in one Yosys batch")
+        stats = self.synthesizer.synthesize_batch(hdl_files, self.output_dir)
+        stats_by_file = dict(zip(hdl_files, stats))
+        
+        for metrics, hdl_file in pending:
+            synth_stats = stats_by_file[hdl_file]
+            metrics.gate_count = synth_stats["gate_count"]
+            metrics.cell_count = synth_stats["cell_count"]
+            metrics.estimated_area = synth_stats["estimated_area"]
+            
+            # Refresh the sidecar of the task directory that owns this HDL
+            digest_file = hdl_file.parent / ".digest"
+            if metrics.fast_skip_reason != "cache_hit" and digest_file.exists():
+                self._write_sidecar(
+                    hdl_file.parent, bytes.fromhex(digest_file.read_text()), metrics
+                )
+    
+    def _fingerprint(self, hdl_code: str, task: BenchmarkTask) -> Optional[bytes]:
+        """Content hash of generated HDL plus reference testbench (None if unreadable)"""
+        try:
+            tb_bytes = Path(task.reference_tb).read_bytes() if task.reference_tb else b""
+        except OSError:
+            return None
+        return hashlib.blake2b(hdl_code.encode("utf-8") + b"||" + tb_bytes).digest()
+    
+    def _record_result(self, metrics: EvaluationMetrics):
+        """Append metrics to results and stream them as one NDJSON line"""
+        line = _json_bytes(metrics.to_dict()) + b"\n"
+        with self._results_lock:
+            self.results.append(metrics)
+            if self._results_fh is None:
+                self._results_fh = open(self.results_stream_file, "ab")
+            self._results_fh.write(line)
+            self._results_fh.flush()
+    
+    async def run_benchmark_async(
+        self,
+        tasks: List[BenchmarkTask],
+        models: List[AIModelInterface]
+    ) -> List[EvaluationMetrics]:
+        """
+        Evaluate every (task, model) pair concurrently
+        
+        Each evaluation is dominated by blocking EDA tool subprocesses, so it
+        runs in a worker thread; a semaphore caps how many are in flight.
+        Synthesis is deferred and run as a single Yosys batch at the end.
+        
+        Returns:
+            Metrics in (model, task) order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        async def run_one(task: BenchmarkTask, model: AIModelInterface) -> EvaluationMetrics:
+            async with semaphore:
+                metrics = await asyncio.to_thread(
+                    self.evaluate_task, task, model, False
+                )
+            print(f"  [{model.model_name}] {task.task_id}: Valid={metrics.syntax_valid}, "
+                  f"Passed={metrics.simulation_passed}")
+            return metrics
+        
+        results = await asyncio.gather(
+            *(run_one(task, model) for model in models for task in tasks)
+        )
+        await asyncio.to_thread(self.synthesize_pending)
+        return results
+    
+    def run_benchmark_processes(
+        self,
+        tasks: List[BenchmarkTask],
+        models: List[AIModelInterface]
+    ) -> List[EvaluationMetrics]:
+        """
+        Evaluate every (task, model) pair in a process pool
+        
+        Each worker builds its own pipeline in _worker_init, sharing this
+        pipeline's output directory. Workers read the persisted caches but
+        their new entries are not merged back, and synthesis runs per task
+        rather than as one batch.
+        
+        Returns:
+            Metrics in (model, task) order
+        """
+        with ProcessPoolExecutor(
+            max_workers=self.max_concurrent,
+            initializer=_worker_init,
+            initargs=(self.output_dir,)
+        ) as pool:
+            futures = [
+                pool.submit(_evaluate_one, task, model)
+                for model in models for task in tasks
+            ]
+            for fut in as_completed(futures):
+                metrics = fut.result()
+                print(f"  [{metrics.model_name}] {metrics.task_id}: "
+                      f"Valid={metrics.syntax_valid}, Passed={metrics.simulation_passed}")
+            results = [fut.result() for fut in futures]
+        
+        # Workers already streamed their records to the NDJSON file
+        with self._results_lock:
+            self.results.extend(results)
+        return results
+    
+    def run_benchmark(
+        self,
+        tasks: List[BenchmarkTask],
+        models: List[AIModelInterface],
+        use_processes: bool = False
+    ):
         """
         Run complete benchmark suite
+        
+        Args:
+            tasks: Benchmark tasks to evaluate
+            models: Models to evaluate each task with
+            use_processes: Evaluate in a process pool instead of worker threads
         """
-        print(f"Starting benchmark with {len(tasks)} tasks and {len(models)} models")
+        print(f"Starting benchmark with {len(tasks)} tasks and {len(models)} models "
+              f"(max_concurrent={self.max_concurrent})")
         
-        for model in models:
-            print(f"\nEvaluating model: {model.model_name}")
-            for task in tasks:
-                metrics = self.evaluate_task(task, model)
-                print(f"  {task.task_id}: Valid={metrics.syntax_valid}, "
-                      f"Passed={metrics.simulation_passed}")
+        if use_processes:
+            self.run_benchmark_processes(tasks, models)
+        else:
+            asyncio.run(self.run_benchmark_async(tasks, models))
         
         # Save results
         self.save_results()
     
     def save_results(self):
-        """Save benchmark results to JSON"""
+        """Save benchmark results to JSON (and Parquet when pyarrow is installed)"""
         results_file = self.output_dir / "benchmark_results.json"
-        with open(results_file, 'w') as f:
-            json.dump([r.to_dict() for r in self.results], f, indent=2)
+        records = [r.to_dict() for r in self.results]
+        with open(results_file, 'wb') as f:
+            f.write(_json_bytes(records, indent=True))
+        if PYARROW_AVAILABLE:
+            table = pa.Table.from_pylist(records, schema=_RESULTS_SCHEMA)
+            pq.write_table(
+                table, self.output_dir / "benchmark_results.parquet", compression="zstd"
+            )
+        if len(self.generation_cache):
+            self.generation_cache.save(self.generation_cache_file)
+        if self._metrics_cache:
+            self._save_metrics_cache()
         print(f"\nResults saved to {results_file}")
     
     def generate_report(self):
@@ -486,6 +1061,18 @@ class BenchmarkPipeline:
             print(f"  Avg generation time: {avg_gen_time:.3f}s")
             print(f"  Avg compile time: {avg_compile_time:.3f}s")
 
+# Per-process pipeline used by run_benchmark_processes workers
+_WORKER_PIPELINE: Optional[BenchmarkPipeline] = None
+
+def _worker_init(output_dir: Path):
+    """ProcessPoolExecutor initializer: build this worker's pipeline"""
+    global _WORKER_PIPELINE
+    _WORKER_PIPELINE = BenchmarkPipeline(output_dir, max_concurrent=1)
+
+def _evaluate_one(task: BenchmarkTask, model: AIModelInterface) -> EvaluationMetrics:
+    """Evaluate one (task, model) pair in a worker process"""
+    return _WORKER_PIPELINE.evaluate_task(task, model)
+
 # Example usage
 if __name__ == "__main__":
     # Setup
@@ -3,6 +3,11 @@ AST-Based Syntactic Augmentation
 Uses Pyverilog to parse and repair Verilog AST
 """
 
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import re
@@ -16,6 +21,11 @@ except ImportError:
     print("⚠ pyverilog not available. Install with: pip install pyverilog")
 
 
+def _scratch_dir() -> str:
+    """Prefer a RAM-backed directory for parser scratch files"""
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
 class ASTRepair:
     """Repairs Verilog code using AST parsing and manipulation"""
     
@@ -23,6 +33,55 @@ class ASTRepair:
         self.enable_ast = enable_ast and PYVERILOG_AVAILABLE
         if not PYVERILOG_AVAILABLE and enable_ast:
             print("⚠ AST repair disabled: pyverilog not installed")
+        # Reusable scratch file for Pyverilog input (created on first parse)
+        self._scratch_fd: Optional[int] = None
+        self._scratch_path: Optional[str] = None
+        # LRU caches: code digest -> AST (or None on parse failure), and
+        # id(ast) -> (ast, regenerated code); holding the AST keeps its id stable
+        self._ast_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._codegen_cache: "OrderedDict[int, tuple]" = OrderedDict()
+        self.cache_size = 256
+        # One instance is shared by parallel task evaluations: serializes the
+        # scratch file, the parser and both caches
+        self._lock = threading.RLock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        self.close()
+    
+    def close(self):
+        """Remove the scratch file"""
+        with self._lock:
+            if self._scratch_fd is not None:
+                os.close(self._scratch_fd)
+                try:
+                    os.unlink(self._scratch_path)
+                except OSError:
+                    pass
+                self._scratch_fd = None
+                self._scratch_path = None
+    
+    def _cache_put(self, cache: OrderedDict, key, value):
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+    
+    def _write_scratch(self, code: str) -> str:
+        """Overwrite the scratch file with code and return its path"""
+        if self._scratch_fd is None:
+            self._scratch_fd, self._scratch_path = tempfile.mkstemp(
+                suffix='.v', dir=_scratch_dir()
+            )
+        os.ftruncate(self._scratch_fd, 0)
+        os.lseek(self._scratch_fd, 0, os.SEEK_SET)
+        os.write(self._scratch_fd, code.encode('utf-8'))
+        return self._scratch_path
     
     def parse_verilog(self, code: str) -> Optional[Any]:
         """
@@ -37,22 +96,22 @@ class ASTRepair:
         if not self.enable_ast:
             return None
         
-        try:
-            # Write code to temporary file (Pyverilog needs file input)
-            from tempfile import NamedTemporaryFile
-            with NamedTemporaryFile(mode='w', suffix='.v', delete=False) as f:
-                f.write(code)
-                temp_path = f.name
+        key = hashlib.blake2b(code.encode('utf-8'), digest_size=16).digest()
+        with self._lock:
+            if key in self._ast_cache:
+                self._ast_cache.move_to_end(key)
+                return self._ast_cache[key]
             
             try:
-                ast, directives = parse([temp_path])
-                return ast
-            finally:
-                Path(temp_path).unlink()
-                
-        except Exception as e:
-            print(f"AST parsing error: {e}")
-            return None
+                # Pyverilog needs file input; reuse one scratch file across calls
+                ast, directives = parse([self._write_scratch(code)])
+                    
+            except Exception as e:
+                print(f"AST parsing error: {e}")
+                ast = None
+            
+            self._cache_put(self._ast_cache, key, ast)
+            return ast
     
     def validate_ast(self, ast: Any) -> List[str]:
         """
@@ -133,12 +192,22 @@ class ASTRepair:
         if ast is None:
             return None
         
+        with self._lock:
+            cached = self._codegen_cache.get(id(ast))
+            if cached is not None and cached[0] is ast:
+                self._codegen_cache.move_to_end(id(ast))
+                return cached[1]
+        
         try:
             from pyverilog.ast_code_generator import codegen
-            return codegen(ast)
+            code = codegen(ast)
         except Exception as e:
             print(f"Code generation error: {e}")
             return None
+        
+        with self._lock:
+            self._cache_put(self._codegen_cache, id(ast), (ast, code))
+        return code
     
     def repair_with_ast(self, code: str, errors: List[str]) -> Optional[str]:
         """
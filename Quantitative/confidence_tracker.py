@@ -3,16 +3,47 @@ Confidence Modeling
 Tracks model confidence via log-probabilities and token entropy
 """
 
+import math
 import time
-from typing import List, Tuple, Optional, Dict
+from collections import Counter
+from functools import lru_cache
+from itertools import combinations
+from typing import Iterable, List, Tuple, Optional, Dict
 from difflib import SequenceMatcher
 
+import numpy as np
+
+try:
+    # C-accelerated pairwise similarity (falls back to difflib)
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+@lru_cache(maxsize=1024)
+def _shingles(s: str, k: int = 4) -> frozenset:
+    """Hashed k-character shingles of s (cached across refinement attempts)"""
+    if len(s) < k:
+        return frozenset((hash(s),))
+    return frozenset(hash(s[i:i + k]) for i in range(len(s) - k + 1))
+
 
 class ConfidenceTracker:
     """Tracks and computes confidence metrics for model generations"""
     
-    def __init__(self, num_samples: int = 3):
+    def __init__(self, num_samples: int = 3, method: str = "edit"):
+        """
+        Args:
+            num_samples: Number of generations sampled per entropy estimate
+            method: Measure used by compute_entropy: "edit" (normalized
+                    edit distance), "jaccard" (4-gram shingle Jaccard
+                    distance; coarser but linear in code length) or "line"
+                    (streaming per-line agreement, see
+                    compute_entropy_streaming)
+        """
         self.num_samples = num_samples
+        self.method = method
         self.confidence_history = []
     
     def compute_entropy(self, generations: List[str]) -> float:
@@ -28,18 +59,45 @@ class ConfidenceTracker:
         if len(generations) < 2:
             return 0.0
         
-        edit_distances = []
-        for i in range(len(generations)):
-            for j in range(i + 1, len(generations)):
-                # Compute normalized edit distance
-                similarity = SequenceMatcher(None, generations[i], generations[j]).ratio()
-                distance = 1.0 - similarity
-                edit_distances.append(distance)
+        if self.method == "line":
+            return self.compute_entropy_streaming(generations)
         
-        if not edit_distances:
+        # Identical generations are at distance 0, so pairwise distances are
+        # only computed between distinct strings and weighted by how many
+        # (i, j) generation pairs each distinct pair stands for
+        counts = Counter(generations)
+        if len(counts) == 1:
             return 0.0
+        unique = list(counts)
+        weights = [counts[g] for g in unique]
+        n = len(generations)
+        num_pairs = n * (n - 1) / 2
         
-        avg_distance = sum(edit_distances) / len(edit_distances)
+        if self.method == "jaccard":
+            shingle_sets = [_shingles(g) for g in unique]
+            avg_distance = sum(
+                weights[i] * weights[j]
+                * (1.0 - len(shingle_sets[i] & shingle_sets[j]) / len(shingle_sets[i] | shingle_sets[j]))
+                for i, j in combinations(range(len(unique)), 2)
+            ) / num_pairs
+        elif RAPIDFUZZ_AVAILABLE:
+            # MxM similarity matrix (0-100) computed in C; use upper triangle
+            similarity = process.cdist(
+                unique, unique, scorer=fuzz.ratio, workers=-1
+            )
+            rows, cols = np.triu_indices(len(unique), k=1)
+            w = np.asarray(weights, dtype=np.float64)
+            avg_distance = float(
+                ((1.0 - similarity[rows, cols] / 100.0) * w[rows] * w[cols]).sum()
+                / num_pairs
+            )
+        else:
+            # Normalized edit distance between each distinct pair
+            avg_distance = sum(
+                weights[i] * weights[j]
+                * (1.0 - SequenceMatcher(None, unique[i], unique[j]).ratio())
+                for i, j in combinations(range(len(unique)), 2)
+            ) / num_pairs
         
         # Normalize by average length
         avg_length = sum(len(g) for g in generations) / len(generations)
@@ -50,6 +108,53 @@ class ConfidenceTracker:
         
         return min(normalized_entropy, 1.0)  # Cap at 1.0
     
+    @staticmethod
+    def compute_entropy_streaming(generations: Iterable[str]) -> float:
+        """
+        Entropy from per-line agreement, consuming generations one at a time
+        
+        Each generation is reduced to the set of hashes of its stripped,
+        non-empty lines and only a Counter of those hashes is kept, so peak
+        memory is O(unique lines) rather than O(samples x code length). For
+        a line seen in k of n generations, p = k / n; the result is the mean
+        binary Shannon entropy -p*log2(p) - (1-p)*log2(1-p) over all lines.
+        
+        Args:
+            generations: Iterable of generated code strings
+            
+        Returns:
+            Entropy value in [0, 1] (0 = all generations identical line-wise)
+        """
+        line_counts: Counter = Counter()
+        n = 0
+        for code in generations:
+            n += 1
+            line_counts.update({hash(line.strip()) for line in code.splitlines() if line.strip()})
+        if n < 2 or not line_counts:
+            return 0.0
+        
+        total = 0.0
+        for k in line_counts.values():
+            p = k / n
+            if p < 1.0:
+                total -= p * math.log2(p) + (1.0 - p) * math.log2(1.0 - p)
+        return total / len(line_counts)
+    
+    @staticmethod
+    def distinct_fraction(generations: List[str]) -> float:
+        """
+        Cheap agreement estimate used to stop sampling early
+        
+        Args:
+            generations: List of generated code strings
+            
+        Returns:
+            0.0 when all generations are identical, 1.0 when all differ
+        """
+        if len(generations) < 2:
+            return 0.0
+        return (len(set(generations)) - 1) / (len(generations) - 1)
+    
     def compute_log_prob_summary(self, log_probs: Optional[List[float]]) -> Optional[Dict[str, float]]:
         """
         Aggregate token-level log probabilities
@@ -63,14 +168,14 @@ class ConfidenceTracker:
         if log_probs is None or not log_probs:
             return None
         
-        import statistics
+        arr = np.asarray(log_probs, dtype=np.float64)
         
         return {
-            "mean": statistics.mean(log_probs),
-            "median": statistics.median(log_probs),
-            "min": min(log_probs),
-            "max": max(log_probs),
-            "std": statistics.stdev(log_probs) if len(log_probs) > 1 else 0.0
+            "mean": float(arr.mean()),
+            "median": float(np.median(arr)),
+            "min": float(arr.min()),
+            "max": float(arr.max()),
+            "std": float(arr.std(ddof=1)) if arr.size > 1 else 0.0
         }
     
     def correlate_with_correctness(
@@ -115,31 +220,11 @@ class ConfidenceTracker:
         if not entropies or len(entropies) != len(successes):
             return {}
         
-        # Compute correlation
-        try:
-            from scipy.stats import pearsonr
-            correlation, p_value = pearsonr(entropies, successes)
-            return {
-                "entropy_success_correlation": correlation,
-                "entropy_success_p_value": p_value
-            }
-        except ImportError:
-            # Fallback: simple correlation
-            if len(entropies) > 1:
-                import statistics
-                mean_entropy = statistics.mean(entropies)
-                mean_success = statistics.mean(successes)
-                
-                # Simple correlation approximation
-                covariance = sum((entropies[i] - mean_entropy) * (successes[i] - mean_success) 
-                                for i in range(len(entropies))) / len(entropies)
-                
-                entropy_std = statistics.stdev(entropies) if len(entropies) > 1 else 1.0
-                success_std = statistics.stdev(successes) if len(successes) > 1 else 1.0
-                
-                if entropy_std > 0 and success_std > 0:
-                    correlation = covariance / (entropy_std * success_std)
-                    return {"entropy_success_correlation": correlation}
-            
+        # Compute Pearson correlation
+        entropy_arr = np.asarray(entropies, dtype=np.float64)
+        success_arr = np.asarray(successes, dtype=np.float64)
+        if entropy_arr.std() == 0 or success_arr.std() == 0:
             return {}
-
+        
+        correlation = float(np.corrcoef(entropy_arr, success_arr)[0, 1])
+        return {"entropy_success_correlation": correlation}
@@ -2,22 +2,116 @@
 Dataset loader for HDL benchmarking tasks
 """
 
+import hashlib
 import json
+import os
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
-@dataclass
+try:
+    # Fast whole-document JSON parsing (preferred over ijson when installed)
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    # Incremental JSON parsing (falls back to json.load)
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    # Binary cache of tasks.json kept next to the manifest
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+@dataclass(slots=True, frozen=True)
 class BenchmarkTask:
-    """Represents a single HDL design task"""
+    """Represents a single HDL design task (immutable and hashable)"""
     task_id: str
     spec: str
     reference_hdl: str
     reference_tb: str
     category: str
     difficulty: str
-    inputs: List[str]
-    outputs: List[str]
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+
+
+def _parse_task_records(json_path: str) -> Iterator[Dict]:
+    """Parse tasks.json with the fastest available JSON backend"""
+    with open(json_path, 'rb') as f:
+        if ORJSON_AVAILABLE:
+            yield from orjson.loads(f.read())
+        elif IJSON_AVAILABLE:
+            yield from ijson.items(f, 'item')
+        else:
+            yield from json.load(f)
+
+
+def _cached_load(json_path: str) -> List[Dict]:
+    """
+    Load task records through a msgpack cache stored beside tasks.json
+    
+    The cache (tasks.json.msgpack) is used while its mtime is not older
+    than the manifest's; otherwise the JSON is parsed and the cache rewritten.
+    
+    Args:
+        json_path: Path to tasks.json file
+        
+    Returns:
+        List of raw task dicts
+    """
+    cache_path = f"{json_path}.msgpack"
+    try:
+        if os.stat(cache_path).st_mtime_ns >= os.stat(json_path).st_mtime_ns:
+            with open(cache_path, 'rb') as f:
+                return msgpack.unpackb(f.read(), raw=False)
+    except (OSError, ValueError, msgpack.UnpackException):
+        # Missing or unreadable cache: rebuild from JSON
+        pass
+    
+    records = list(_parse_task_records(json_path))
+    packed = msgpack.packb(records, use_bin_type=True)
+    # Only keep a cache that round-trips to the same number of records
+    if len(msgpack.unpackb(packed, raw=False)) == len(records):
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(packed)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Read-only dataset tree: keep parsing JSON each time
+            pass
+    return records
+
+
+def iter_task_records(json_path: str) -> Iterator[Dict]:
+    """
+    Yield raw task records from a tasks.json array
+    
+    Reads the msgpack cache when msgpack is installed. Otherwise parses
+    with orjson, or ijson so records stream off disk one at a time instead
+    of buffering the whole manifest.
+    
+    Args:
+        json_path: Path to tasks.json file
+        
+    Yields:
+        One task dict per array element
+    """
+    if MSGPACK_AVAILABLE:
+        yield from _cached_load(json_path)
+    else:
+        yield from _parse_task_records(json_path)
 
 
 def load_tasks_from_json(json_path: str, dataset_root: str = None) -> List[BenchmarkTask]:
@@ -31,76 +125,214 @@ def load_tasks_from_json(json_path: str, dataset_root: str = None) -> List[Bench
     Returns:
         List of BenchmarkTask objects
     """
-    json_file = Path(json_path)
-    
     if dataset_root is None:
-        dataset_root = json_file.parent
-    else:
-        dataset_root = Path(dataset_root)
-    
-    with open(json_file, 'r') as f:
-        tasks_data = json.load(f)
+        dataset_root = os.path.dirname(json_path)
+    root_str = str(dataset_root)
+    join = os.path.join
     
     tasks = []
-    for task_data in tasks_data:
+    for task_data in iter_task_records(json_path):
         # Convert relative paths to absolute paths
-        ref_hdl = dataset_root / task_data['reference_hdl']
-        ref_tb = dataset_root / task_data['reference_tb']
-        
-        task = BenchmarkTask(
+        tasks.append(BenchmarkTask(
             task_id=task_data['task_id'],
             spec=task_data['specification'],
-            reference_hdl=str(ref_hdl),
-            reference_tb=str(ref_tb),
+            reference_hdl=join(root_str, task_data['reference_hdl']),
+            reference_tb=join(root_str, task_data['reference_tb']),
             category=task_data['category'],
             difficulty=task_data.get('difficulty', 'medium'),
-            inputs=task_data.get('inputs', []),
-            outputs=task_data.get('outputs', [])
-        )
-        tasks.append(task)
+            inputs=tuple(task_data.get('inputs', ())),
+            outputs=tuple(task_data.get('outputs', ()))
+        ))
     
     return tasks
 
 
-def validate_dataset(tasks: List[BenchmarkTask]) -> bool:
+def _index_dataset(root: Path) -> Set[str]:
+    """
+    Collect every file path under root in a single directory walk
+    
+    Args:
+        root: Dataset root directory
+        
+    Returns:
+        Set of normalized file paths
+    """
+    known = set()
+    for dirpath, _, filenames in os.walk(root, followlinks=True):
+        for filename in filenames:
+            known.add(os.path.normpath(os.path.join(dirpath, filename)))
+    return known
+
+
+def _tasks_fingerprint(tasks: List[BenchmarkTask]) -> str:
+    """SHA-1 over every task's reference file paths"""
+    digest = hashlib.sha1()
+    for task in tasks:
+        digest.update(f"{task.task_id}\0{task.reference_hdl}\0{task.reference_tb}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def validate_dataset(
+    tasks: List[BenchmarkTask],
+    dataset_root: Optional[str] = None,
+    force: bool = False
+) -> bool:
     """
     Validate that all reference files exist
     
+    The dataset tree is indexed with one directory walk and each reference
+    file is checked by set membership, instead of a stat() per file.
+    
+    A successful pass writes a _VALIDATED marker holding a fingerprint of the
+    task list into dataset_root; later calls with the same tasks return
+    immediately. A failed pass writes _INVALID.json listing the missing files.
+    
     Args:
         tasks: List of BenchmarkTask objects
+        dataset_root: Root directory holding the reference files (derived
+                      from the tasks' common path if None)
+        force: Re-check files even if the _VALIDATED marker matches
         
     Returns:
         True if all files exist, False otherwise
     """
-    all_valid = True
+    missing = []
+    warnings = []
+    
+    if dataset_root is None and tasks:
+        try:
+            dataset_root = os.path.commonpath(
+                [task.reference_hdl for task in tasks] + [task.reference_tb for task in tasks]
+            )
+        except ValueError:
+            # Mix of absolute and relative paths
+            dataset_root = None
+    
+    if dataset_root is not None and not os.path.isdir(dataset_root):
+        dataset_root = None
+    
+    fingerprint = _tasks_fingerprint(tasks)
+    if dataset_root is not None and not force:
+        try:
+            if (Path(dataset_root) / "_VALIDATED").read_text().strip() == fingerprint:
+                print(f"✓ All {len(tasks)} tasks validated successfully (cached)")
+                return True
+        except OSError:
+            pass
+    
+    known = None
+    if dataset_root is not None:
+        known = _index_dataset(Path(dataset_root))
+    
+    def file_exists(path: str) -> bool:
+        if known is None:
+            # Unknown root: fall back to one stat per file
+            return os.path.isfile(path)
+        return os.path.normpath(path) in known
     
     for task in tasks:
-        hdl_file = Path(task.reference_hdl)
-        tb_file = Path(task.reference_tb)
-        
-        if not hdl_file.exists():
-            print(f"⚠ Missing reference HDL: {task.task_id} - {hdl_file}")
-            all_valid = False
+        if not file_exists(task.reference_hdl):
+            warnings.append(f"⚠ Missing reference HDL: {task.task_id} - {task.reference_hdl}")
+            missing.append(task.reference_hdl)
         
-        if not tb_file.exists():
-            print(f"⚠ Missing testbench: {task.task_id} - {tb_file}")
-            all_valid = False
+        if not file_exists(task.reference_tb):
+            warnings.append(f"⚠ Missing testbench: {task.task_id} - {task.reference_tb}")
+            missing.append(task.reference_tb)
     
+    all_valid = not missing
     if all_valid:
         print(f"✓ All {len(tasks)} tasks validated successfully")
     else:
-        print(f"✗ Some files are missing")
+        # One write for the whole report instead of a print per missing file
+        warnings.append("✗ Some files are missing\n")
+        sys.stdout.write("\n".join(warnings))
+    
+    if dataset_root is not None:
+        _write_validation_markers(Path(dataset_root), fingerprint, missing)
     
     return all_valid
 
 
-def get_tasks_by_category(tasks: List[BenchmarkTask], category: str) -> List[BenchmarkTask]:
-    """Filter tasks by category"""
+def _write_validation_markers(dataset_root: Path, fingerprint: str, missing: List[str]):
+    """Record the outcome of validate_dataset in dataset_root (best effort)"""
+    valid_marker = dataset_root / "_VALIDATED"
+    invalid_marker = dataset_root / "_INVALID.json"
+    try:
+        if missing:
+            valid_marker.unlink(missing_ok=True)
+            invalid_marker.write_text(json.dumps(
+                {"fingerprint": fingerprint, "missing": missing}, indent=2
+            ))
+        else:
+            invalid_marker.unlink(missing_ok=True)
+            valid_marker.write_text(fingerprint + "\n")
+    except OSError:
+        # Read-only dataset tree: validation still works, just uncached
+        pass
+
+
+TaskIndex = Dict[str, List[BenchmarkTask]]
+
+
+def build_task_index(tasks: List[BenchmarkTask]) -> Tuple[TaskIndex, TaskIndex]:
+    """
+    Group tasks by category and by difficulty in one pass
+    
+    Callers filtering the same task list more than a couple of times should
+    build this once and pass it to get_tasks_by_category/difficulty.
+    
+    Args:
+        tasks: List of BenchmarkTask objects
+        
+    Returns:
+        Tuple of (by_category, by_difficulty) dicts
+    """
+    by_category = defaultdict(list)
+    by_difficulty = defaultdict(list)
+    for task in tasks:
+        by_category[task.category].append(task)
+        by_difficulty[task.difficulty].append(task)
+    return dict(by_category), dict(by_difficulty)
+
+
+@lru_cache(maxsize=8)
+def _load_indexed(json_path: str, mtime_ns: int) -> Tuple[Tuple[BenchmarkTask, ...], TaskIndex, TaskIndex]:
+    tasks = tuple(load_tasks_from_json(json_path))
+    return (tasks, *build_task_index(tasks))
+
+
+def load_indexed_tasks(json_path: str) -> Tuple[Tuple[BenchmarkTask, ...], TaskIndex, TaskIndex]:
+    """
+    Load tasks and their indexes, cached until tasks.json changes
+    
+    Args:
+        json_path: Path to tasks.json file
+        
+    Returns:
+        Tuple of (tasks, by_category, by_difficulty)
+    """
+    return _load_indexed(str(json_path), os.stat(json_path).st_mtime_ns)
+
+
+def get_tasks_by_category(
+    tasks: List[BenchmarkTask],
+    category: str,
+    index: Optional[TaskIndex] = None
+) -> List[BenchmarkTask]:
+    """Filter tasks by category (O(1) with a by_category index from build_task_index)"""
+    if index is not None:
+        return list(index.get(category, []))
     return [task for task in tasks if task.category == category]
 
 
-def get_tasks_by_difficulty(tasks: List[BenchmarkTask], difficulty: str) -> List[BenchmarkTask]:
-    """Filter tasks by difficulty"""
+def get_tasks_by_difficulty(
+    tasks: List[BenchmarkTask],
+    difficulty: str,
+    index: Optional[TaskIndex] = None
+) -> List[BenchmarkTask]:
+    """Filter tasks by difficulty (O(1) with a by_difficulty index from build_task_index)"""
+    if index is not None:
+        return list(index.get(difficulty, []))
     return [task for task in tasks if task.difficulty == difficulty]
 
 
@@ -112,20 +344,17 @@ def print_dataset_stats(tasks: List[BenchmarkTask]):
     
     print(f"Total tasks: {len(tasks)}")
     
-    # By category
-    categories = {}
+    # Count categories and difficulties in one pass
+    categories = Counter()
+    difficulties = Counter()
     for task in tasks:
-        categories[task.category] = categories.get(task.category, 0) + 1
+        categories[task.category] += 1
+        difficulties[task.difficulty] += 1
     
     print("\nBy Category:")
     for cat, count in sorted(categories.items()):
         print(f"  {cat:15s}: {count:3d} tasks")
     
-    # By difficulty
-    difficulties = {}
-    for task in tasks:
-        difficulties[task.difficulty] = difficulties.get(task.difficulty, 0) + 1
-    
     print("\nBy Difficulty:")
     for diff, count in sorted(difficulties.items()):
         print(f"  {diff:15s}: {count:3d} tasks")
@@ -3,40 +3,93 @@ Dataset Visualization Script
 Generates publication-quality figures for dataset documentation
 """
 
-import json
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 from collections import Counter
 
-# Set publication-quality style
-plt.style.use('seaborn-v0_8-paper')
-sns.set_palette("husl")
+from dataset_loader import iter_task_records
+
+DIFFICULTY_ORDER = ['easy', 'medium', 'hard']
+RASTER_FORMATS = {'.png', '.jpg', '.jpeg', '.tif', '.tiff'}
+
+# numpy/matplotlib/seaborn are imported on first plot so that importing
+# this module (e.g. for load_dataset_stats) stays cheap
+_styled = False
+
+def _plotting():
+    """Import the plotting stack and set publication-quality style once
+    
+    Returns:
+        Tuple of (matplotlib.pyplot, seaborn)
+    """
+    global _styled
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    if not _styled:
+        plt.style.use('seaborn-v0_8-paper')
+        sns.set_palette("husl")
+        _styled = True
+    return plt, sns
 
 def load_dataset_stats(tasks_json_path: str):
     """Load and compute dataset statistics"""
-    with open(tasks_json_path, 'r') as f:
-        tasks = json.load(f)
-    
-    # Extract statistics
-    categories = [task['category'] for task in tasks]
-    difficulties = [task['difficulty'] for task in tasks]
-    
-    category_counts = Counter(categories)
-    difficulty_counts = Counter(difficulties)
+    # Stream task records, counting as they are parsed
+    tasks = []
+    category_counts = Counter()
+    difficulty_counts = Counter()
+    pair_counts = Counter()
+    for task in iter_task_records(tasks_json_path):
+        tasks.append(task)
+        category_counts[task['category']] += 1
+        difficulty_counts[task['difficulty']] += 1
+        pair_counts[(task['category'], task['difficulty'])] += 1
     
     return {
         'total_tasks': len(tasks),
         'category_counts': category_counts,
         'difficulty_counts': difficulty_counts,
+        'pair_counts': pair_counts,
         'tasks': tasks
     }
 
+def _category_difficulty_matrix(stats: dict):
+    """
+    Category × difficulty count matrix, built once and cached in stats
+    
+    Returns:
+        Tuple of (int32 matrix with easy/medium/hard columns, sorted category
+        row labels), or None if there are no tasks
+    """
+    if 'heatmap' not in stats:
+        import numpy as np
+        
+        pair_counts = stats.get('pair_counts')
+        if pair_counts is None:
+            pair_counts = Counter((t['category'], t['difficulty']) for t in stats['tasks'])
+        if pair_counts:
+            categories = sorted({cat for cat, _ in pair_counts})
+            matrix = np.array(
+                [[pair_counts[(cat, diff)] for diff in DIFFICULTY_ORDER] for cat in categories],
+                dtype=np.int32
+            )
+            stats['heatmap'] = (matrix, categories)
+        else:
+            stats['heatmap'] = None
+    return stats['heatmap']
+
+def _save_figure(output_path):
+    """Save the current figure; vector formats skip 300-dpi rasterization"""
+    import matplotlib.pyplot as plt
+    if Path(output_path).suffix.lower() in RASTER_FORMATS:
+        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    else:
+        plt.savefig(output_path, bbox_inches='tight')
+    print(f"Saved: {output_path}")
+
 def plot_dataset_distribution(stats: dict, output_path: str = None):
     """
     Create a comprehensive dataset distribution figure
     """
+    plt, sns = _plotting()
     fig, axes = plt.subplots(1, 3, figsize=(18, 6))
     
     # 1. Category Distribution (Pie Chart)
@@ -80,14 +133,12 @@ def plot_dataset_distribution(stats: dict, output_path: str = None):
     # 3. Category vs Difficulty Heatmap
     ax3 = axes[2]
     
-    # Create cross-tabulation
-    task_df = pd.DataFrame(stats['tasks'])
-    if not task_df.empty:
-        crosstab = pd.crosstab(task_df['category'], task_df['difficulty'])
-        crosstab = crosstab.reindex(columns=['easy', 'medium', 'hard'], fill_value=0)
-        
+    # Category × difficulty counts
+    heatmap = _category_difficulty_matrix(stats)
+    if heatmap is not None:
+        matrix, categories = heatmap
         sns.heatmap(
-            crosstab,
+            matrix,
             annot=True,
             fmt='d',
             cmap='YlOrRd',
@@ -99,15 +150,14 @@ def plot_dataset_distribution(stats: dict, output_path: str = None):
         ax3.set_ylabel('Category', fontsize=12)
         ax3.set_title('Category × Difficulty Matrix', fontsize=14, fontweight='bold')
         ax3.set_xticklabels(['Easy', 'Medium', 'Hard'])
-        ax3.set_yticklabels([cat.title() for cat in crosstab.index], rotation=0)
+        ax3.set_yticklabels([cat.title() for cat in categories], rotation=0)
     
     plt.suptitle(f'Dataset Overview: {stats["total_tasks"]} Tasks', 
                  fontsize=16, fontweight='bold', y=1.02)
     plt.tight_layout()
     
     if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        print(f"Saved: {output_path}")
+        _save_figure(output_path)
     else:
         plt.show()
     
@@ -117,6 +167,7 @@ def plot_task_structure_diagram(output_path: str = None):
     """
     Create a flow diagram showing task structure
     """
+    plt, sns = _plotting()
     from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
     
     fig, ax = plt.subplots(figsize=(14, 8))
@@ -184,8 +235,7 @@ def plot_task_structure_diagram(output_path: str = None):
     plt.tight_layout()
     
     if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        print(f"Saved: {output_path}")
+        _save_figure(output_path)
     else:
         plt.show()
     
@@ -195,6 +245,7 @@ def plot_dataset_statistics_dashboard(stats: dict, output_path: str = None):
     """
     Create a comprehensive statistics dashboard
     """
+    plt, sns = _plotting()
     fig = plt.figure(figsize=(16, 10))
     gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
     
@@ -245,13 +296,11 @@ def plot_dataset_statistics_dashboard(stats: dict, output_path: str = None):
     
     # 4. Category × Difficulty heatmap (middle row, spanning)
     ax4 = fig.add_subplot(gs[1, :])
-    task_df = pd.DataFrame(stats['tasks'])
-    if not task_df.empty:
-        crosstab = pd.crosstab(task_df['category'], task_df['difficulty'])
-        crosstab = crosstab.reindex(columns=['easy', 'medium', 'hard'], fill_value=0)
-        
+    heatmap = _category_difficulty_matrix(stats)
+    if heatmap is not None:
+        matrix, categories = heatmap
         sns.heatmap(
-            crosstab,
+            matrix,
             annot=True,
             fmt='d',
             cmap='YlOrRd',
@@ -264,7 +313,7 @@ def plot_dataset_statistics_dashboard(stats: dict, output_path: str = None):
         ax4.set_ylabel('Category', fontsize=12)
         ax4.set_title('Category × Difficulty Distribution', fontsize=14, fontweight='bold')
         ax4.set_xticklabels(['Easy', 'Medium', 'Hard'])
-        ax4.set_yticklabels([cat.title() for cat in crosstab.index], rotation=0)
+        ax4.set_yticklabels([cat.title() for cat in categories], rotation=0)
     
     # 5. Task naming pattern examples (bottom left)
     ax5 = fig.add_subplot(gs[2, 0])
@@ -324,8 +373,7 @@ def plot_dataset_statistics_dashboard(stats: dict, output_path: str = None):
     plt.suptitle('Dataset Statistics Dashboard', fontsize=16, fontweight='bold', y=0.995)
     
     if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        print(f"Saved: {output_path}")
+        _save_figure(output_path)
     else:
         plt.show()
     
@@ -350,10 +398,10 @@ def main():
     
     print("\nGenerating dataset visualizations...")
     
-    # Generate all plots
-    plot_dataset_distribution(stats, output_dir / "dataset_distribution.png")
-    plot_task_structure_diagram(output_dir / "task_structure_diagram.png")
-    plot_dataset_statistics_dashboard(stats, output_dir / "dataset_statistics_dashboard.png")
+    # Generate all plots (vector PDF: smaller and faster than 300-dpi PNG)
+    plot_dataset_distribution(stats, output_dir / "dataset_distribution.pdf")
+    plot_task_structure_diagram(output_dir / "task_structure_diagram.pdf")
+    plot_dataset_statistics_dashboard(stats, output_dir / "dataset_statistics_dashboard.pdf")
     
     print(f"\nAll visualizations saved to: {output_dir}")
 
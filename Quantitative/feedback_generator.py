@@ -5,6 +5,15 @@ Converts errors and repair hints into natural language feedback for model prompt
 
 from typing import List, Dict, Optional
 
+# Fixed headers and closing instructions for each feedback section
+_COMPILE_HEADER = "Compilation errors found:\n"
+_COMPILE_FOOTER = "\nPlease fix these errors in your Verilog code."
+_SEMANTIC_HEADER = "Semantic analysis suggests:\n"
+_SEMANTIC_FOOTER = "\nPlease address these issues in your design."
+_WAVEFORM_FOOTER = "\nPlease review the logic implementation."
+# Blank-line-padded rule between combined feedback sections
+_SECTION_SEPARATOR = "\n\n---\n\n"
+
 
 class FeedbackGenerator:
     """Generates feedback from errors and analysis for iterative refinement"""
@@ -25,16 +34,16 @@ class FeedbackGenerator:
         if not compile_errors:
             return ""
         
-        feedback = "Compilation errors found:\n"
+        parts = [_COMPILE_HEADER]
         for i, error in enumerate(compile_errors[:5], 1):
             # Clean up error message
             clean_error = error.strip()
             if len(clean_error) > 100:
                 clean_error = clean_error[:100] + "..."
-            feedback += f"{i}. {clean_error}\n"
+            parts.append(f"{i}. {clean_error}\n")
         
-        feedback += "\nPlease fix these errors in your Verilog code."
-        return feedback[:self.max_length]
+        parts.append(_COMPILE_FOOTER)
+        return "".join(parts)[:self.max_length]
     
     def simulation_feedback(
         self,
@@ -62,7 +71,7 @@ class FeedbackGenerator:
             feedback_parts.append("\nWaveform mismatches detected:\n")
             for signal, mismatches in list(waveform_diff.items())[:3]:
                 feedback_parts.append(f"- Signal '{signal}' has {len(mismatches)} mismatch(es)\n")
-            feedback_parts.append("\nPlease review the logic implementation.")
+            feedback_parts.append(_WAVEFORM_FOOTER)
         
         feedback = "".join(feedback_parts)
         return feedback[:self.max_length] if feedback else ""
@@ -80,12 +89,10 @@ class FeedbackGenerator:
         if not repair_hints:
             return ""
         
-        feedback = "Semantic analysis suggests:\n"
-        for i, hint in enumerate(repair_hints[:5], 1):
-            feedback += f"{i}. {hint}\n"
-        
-        feedback += "\nPlease address these issues in your design."
-        return feedback[:self.max_length]
+        parts = [_SEMANTIC_HEADER]
+        parts.extend(f"{i}. {hint}\n" for i, hint in enumerate(repair_hints[:5], 1))
+        parts.append(_SEMANTIC_FOOTER)
+        return "".join(parts)[:self.max_length]
     
     def combine_feedback(
         self,
@@ -104,28 +111,25 @@ class FeedbackGenerator:
         Returns:
             Combined feedback string
         """
-        feedback_parts = []
-        
-        if compile_fb:
-            feedback_parts.append(compile_fb)
-        
-        if sim_fb:
-            if feedback_parts:
-                feedback_parts.append("\n---\n")
-            feedback_parts.append(sim_fb)
-        
-        if semantic_fb:
-            if feedback_parts:
-                feedback_parts.append("\n---\n")
-            feedback_parts.append(semantic_fb)
-        
-        combined = "\n".join(feedback_parts)
-        
-        # Truncate if too long
-        if len(combined) > self.max_length:
-            combined = combined[:self.max_length-3] + "..."
-        
-        return combined
+        parts = [fb for fb in (compile_fb, sim_fb, semantic_fb) if fb]
+        total = sum(map(len, parts)) + len(_SECTION_SEPARATOR) * (len(parts) - 1) if parts else 0
+        if total <= self.max_length:
+            return _SECTION_SEPARATOR.join(parts)
+        
+        # Too long: copy only what fits in the budget, then mark the cut
+        budget = self.max_length - 3
+        out = []
+        used = 0
+        for part in parts:
+            if out:
+                part = _SECTION_SEPARATOR + part
+            if used + len(part) >= budget:
+                out.append(part[:budget - used])
+                break
+            out.append(part)
+            used += len(part)
+        out.append("...")
+        return "".join(out)
     
     def generate_iteration_prompt(
         self,
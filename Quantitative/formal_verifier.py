@@ -3,31 +3,182 @@ Formal Verification Integration
 Uses Yosys equiv_check for logic equivalence verification
 """
 
+import os
+import queue
 import subprocess
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 import re
 
+# Yosys script for equivalence checking (filled with str.format)
+_EQUIV_SCRIPT_TMPL = """
+# Read both designs
+read_verilog {ref}
+hierarchy -auto-top -check
+proc; opt; fsm; opt; memory; opt
+rename -top ref_design
+
+read_verilog {gen}
+hierarchy -auto-top -check
+proc; opt; fsm; opt; memory; opt
+rename -top gen_design
+
+# Equivalence check
+equiv_make ref_design gen_design equiv
+equiv_simple -seq 10
+equiv_status -assert
+"""
+
+_COUNTEREXAMPLE_RE = re.compile(
+    r'Counterexample[:\s]+(.*?)(?:\n|$)', re.IGNORECASE | re.DOTALL
+)
+
+
+@lru_cache(maxsize=1)
+def _check_yosys() -> bool:
+    """Check if Yosys is available (probed once per process)"""
+    try:
+        result = subprocess.run(
+            ["yosys", "-V"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        return result.returncode == 0
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+
 
 class FormalVerifier:
-    """Performs formal equivalence checking using Yosys"""
+    """Performs formal equivalence checking using Yosys
     
-    def __init__(self, enable_verification: bool = False):
+    With persistent=True (or used as a context manager), one long-lived
+    Yosys shell serves every equiv_check call (each starting from
+    `design -reset`), so Yosys startup is paid once per session instead of
+    once per task. Otherwise each check runs its own `yosys -s` process.
+    Session checks run as `script <equiv_check.ys>`, so the first command
+    error aborts that check just as it ends a `yosys -s` run.
+    """
+    
+    def __init__(self, enable_verification: bool = False, persistent: bool = False):
         self.enable_verification = enable_verification
-        self.yosys_available = self._check_yosys()
+        self.yosys_available = _check_yosys()
+        self._session: Optional[subprocess.Popen] = None
+        self._session_lines: Optional[queue.Queue] = None
+        self._session_errs: Optional[queue.Queue] = None
+        self._session_err_pump: Optional[threading.Thread] = None
+        self._session_lock = threading.Lock()
+        self._use_session = persistent and enable_verification and self.yosys_available
+        self._check_count = 0
+    
+    def __enter__(self):
+        self._use_session = self.enable_verification and self.yosys_available
+        return self
     
-    def _check_yosys(self) -> bool:
-        """Check if Yosys is available"""
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _start_session(self):
+        """Spawn a persistent Yosys shell reading commands from stdin"""
+        proc = subprocess.Popen(
+            ["yosys", "-Q"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+        lines: queue.Queue = queue.Queue()
+        errs: queue.Queue = queue.Queue()
+        
+        def _pump(stream, sink: queue.Queue):
+            for line in stream:
+                sink.put(line)
+            sink.put(None)  # EOF: Yosys exited
+        
+        threading.Thread(target=_pump, args=(proc.stdout, lines), daemon=True).start()
+        err_pump = threading.Thread(target=_pump, args=(proc.stderr, errs), daemon=True)
+        err_pump.start()
+        self._session = proc
+        self._session_lines = lines
+        self._session_errs = errs
+        self._session_err_pump = err_pump
+    
+    def close(self):
+        """Shut down the persistent Yosys shell, if any"""
+        self._use_session = False
+        proc, self._session = self._session, None
+        if proc is None:
+            return
         try:
-            result = subprocess.run(
-                ["yosys", "-V"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+            proc.stdin.write("exit\n")
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+    
+    def _drain_session_errs(self) -> str:
+        """Collect the stderr lines Yosys has written so far"""
+        errs = []
+        while True:
+            try:
+                line = self._session_errs.get_nowait()
+            except queue.Empty:
+                break
+            if line is not None:
+                errs.append(line)
+        return "".join(errs)
+    
+    def _run_in_session(self, script_file: Path, timeout: int) -> Tuple[str, str]:
+        """
+        Run a script file in the persistent Yosys shell
+        
+        The file is run with the `script` command, so a command error
+        aborts the rest of it (as with `yosys -s`) instead of the shell
+        carrying on with the next line.
+        
+        Args:
+            script_file: Yosys script to run
+            timeout: Timeout in seconds
+            
+        Returns:
+            (stdout, stderr) Yosys output for this script
+            
+        Raises:
+            subprocess.TimeoutExpired: If the sentinel is not seen in time
+        """
+        if self._session is None:
+            self._start_session()
+        self._check_count += 1
+        sentinel = f"=== DONE {self._check_count} ==="
+        
+        self._session.stdin.write(f'design -reset\nscript "{script_file.resolve()}"\nlog {sentinel}\n')
+        self._session.stdin.flush()
+        
+        output = []
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._session_lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                # Hung check: drop this shell; the next call starts a new one
+                self._session.kill()
+                self._session = None
+                raise subprocess.TimeoutExpired(["yosys"], timeout)
+            if line is None:
+                # Fatal Yosys error ends the shell; its output is the report
+                self._session = None
+                self._session_err_pump.join(timeout=1)
+                break
+            # Skip echoes of the log command itself
+            if line.rstrip().endswith(sentinel) and "log " not in line and "`" not in line:
+                break
+            output.append(line)
+        return "".join(output), self._drain_session_errs()
     
     def equiv_check(
         self,
@@ -57,26 +208,18 @@ class FormalVerifier:
         
         try:
             # Create Yosys script for equivalence check
-            script = f"""
-# Read both designs
-read_verilog {ref_hdl}
-hierarchy -top -check
-proc; opt; fsm; opt; memory; opt
-rename -top ref_design
-
-read_verilog {gen_hdl}
-hierarchy -top -check
-proc; opt; fsm; opt; memory; opt
-rename -top gen_design
-
-# Equivalence check
-equiv_make ref_design gen_design equiv
-equiv_simple -seq 10
-equiv_status -assert
-"""
+            # Absolute paths: `yosys -s` runs in output_dir, the session does not
+            script = _EQUIV_SCRIPT_TMPL.format(ref=Path(ref_hdl).resolve(), gen=Path(gen_hdl).resolve())
             script_file = output_dir / "equiv_check.ys"
             script_file.write_text(script)
             
+            if self._use_session:
+                with self._session_lock:
+                    stdout, stderr = self._run_in_session(script_file, timeout)
+                report_path = output_dir / "equiv_report.txt"
+                report_path.write_text(stdout + "\n" + stderr)
+                return self.parse_equiv_report(stdout, stderr)
+            
             # Run Yosys
             result = subprocess.run(
                 ["yosys", "-s", str(script_file)],
@@ -105,6 +248,49 @@ equiv_status -assert
                 "errors": [str(e)]
             }
     
+    def equiv_check_batch(
+        self,
+        pairs: List[Tuple[Path, Path, Path]],
+        max_workers: Optional[int] = None,
+        timeout: int = 60
+    ) -> List[Dict[str, any]]:
+        """
+        Run independent equivalence checks in parallel
+        
+        Each worker process owns a persistent Yosys shell (see _spawn_yosys),
+        so checks scale across cores while Yosys starts once per worker.
+        
+        Args:
+            pairs: (ref_hdl, gen_hdl, output_dir) triples
+            max_workers: Worker processes (defaults to os.cpu_count())
+            timeout: Per-check timeout in seconds
+            
+        Returns:
+            One equiv_check result per pair, in input order
+        """
+        if not self.enable_verification or not self.yosys_available or len(pairs) < 2:
+            return [self.equiv_check(ref, gen, out, timeout) for ref, gen, out in pairs]
+        
+        results: List[Optional[Dict[str, any]]] = [None] * len(pairs)
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers or os.cpu_count() or 1, len(pairs)),
+            initializer=_spawn_yosys
+        ) as pool:
+            futures = {
+                pool.submit(_equiv_check_worker, ref, gen, out, timeout): i
+                for i, (ref, gen, out) in enumerate(pairs)
+            }
+            for fut in as_completed(futures):
+                try:
+                    results[futures[fut]] = fut.result()
+                except Exception as e:
+                    results[futures[fut]] = {
+                        "status": "error",
+                        "equivalent": None,
+                        "errors": [str(e)]
+                    }
+        return results
+    
     def parse_equiv_report(
         self,
         stdout: str,
@@ -137,11 +323,7 @@ equiv_status -assert
             result["status"] = "counterexample"
             result["equivalent"] = False
             # Extract counterexample details
-            counterexample_match = re.search(
-                r'Counterexample[:\s]+(.*?)(?:\n|$)',
-                output,
-                re.IGNORECASE | re.DOTALL
-            )
+            counterexample_match = _COUNTEREXAMPLE_RE.search(output)
             if counterexample_match:
                 result["counterexamples"].append(counterexample_match.group(1))
         elif "Error" in output or "error" in stderr:
@@ -182,3 +364,16 @@ equiv_status -assert
         
         return hints
 
+
+
+# Per-process verifier used by equiv_check_batch workers
+_WORKER_VERIFIER: Optional[FormalVerifier] = None
+
+def _spawn_yosys():
+    """ProcessPoolExecutor initializer: give this worker a persistent Yosys shell"""
+    global _WORKER_VERIFIER
+    _WORKER_VERIFIER = FormalVerifier(enable_verification=True, persistent=True)
+
+def _equiv_check_worker(ref_hdl: Path, gen_hdl: Path, output_dir: Path, timeout: int) -> Dict[str, any]:
+    """Run one equivalence check in a worker process"""
+    return _WORKER_VERIFIER.equiv_check(ref_hdl, gen_hdl, output_dir, timeout)
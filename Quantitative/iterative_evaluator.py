@@ -3,19 +3,44 @@ Adaptive Iterative Refinement Loop
 Implements iterative evaluation with adaptive stopping logic
 """
 
-from typing import List, Dict, Optional, Tuple, Any
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple, Any
 from pathlib import Path
+import math
+import os
 import time
 
-from Eval_Pipeline import BenchmarkTask, EvaluationMetrics, HDLCompiler, HDLSimulator
-from semantic_repair import SemanticRepair
-from confidence_tracker import ConfidenceTracker
+from Eval_Pipeline import BenchmarkTask, EvaluationMetrics, GenerationCache, HDLCompiler, HDLSimulator
 from feedback_generator import FeedbackGenerator
-from waveform_analyzer import WaveformAnalyzer
-from formal_verifier import FormalVerifier
 from phase4_config import Phase4Config
 from run_phase2 import extract_module_name, get_constrained_prompt
 
+if TYPE_CHECKING:
+    # Analysis components are injected by the caller; importing them here
+    # would pull in pyverilog/VCD/Yosys helpers and numpy for every user
+    from confidence_tracker import ConfidenceTracker
+    from formal_verifier import FormalVerifier
+    from semantic_repair import SemanticRepair
+    from waveform_analyzer import WaveformAnalyzer, WaveformComparator
+
+# Text wrapped around the previous attempt's feedback in refinement prompts
+_FEEDBACK_PREAMBLE = "\n\n---\nFEEDBACK FROM PREVIOUS ATTEMPT:\n"
+_FEEDBACK_EPILOGUE = "\n\nPlease address the issues above and regenerate the Verilog code."
+
+
+def _cisc_score(metrics: EvaluationMetrics) -> float:
+    """Confidence-weighted pass rate: (passed / total) * exp(-entropy)"""
+    pass_rate = metrics.test_cases_passed / max(metrics.test_cases_total, 1)
+    return pass_rate * math.exp(-(metrics.confidence_entropy or 0.0))
+
+
+def _selection_key(entry: Dict) -> Tuple[bool, float]:
+    """Ranking key for one iteration_history entry"""
+    metrics = entry["metrics"]
+    passed = metrics.syntax_valid and metrics.simulation_passed
+    return passed, _cisc_score(metrics) if passed else entry["score"]
+
 
 class IterativeEvaluator:
     """Evaluates tasks with iterative refinement and adaptive stopping"""
@@ -25,11 +50,13 @@ class IterativeEvaluator:
         config: Phase4Config,
         compiler: HDLCompiler,
         simulator: HDLSimulator,
-        semantic_repair: Optional[SemanticRepair] = None,
-        confidence_tracker: Optional[ConfidenceTracker] = None,
+        semantic_repair: Optional["SemanticRepair"] = None,
+        confidence_tracker: Optional["ConfidenceTracker"] = None,
         feedback_generator: Optional[FeedbackGenerator] = None,
-        waveform_analyzer: Optional[WaveformAnalyzer] = None,
-        formal_verifier: Optional[FormalVerifier] = None,
+        waveform_analyzer: Optional["WaveformAnalyzer"] = None,
+        formal_verifier: Optional["FormalVerifier"] = None,
+        waveform_comparator: Optional["WaveformComparator"] = None,
+        prompt_cache: Optional[GenerationCache] = None,
     ):
         self.config = config
         self.compiler = compiler
@@ -39,10 +66,222 @@ class IterativeEvaluator:
         self.feedback_generator = feedback_generator or FeedbackGenerator()
         self.waveform_analyzer = waveform_analyzer
         self.formal_verifier = formal_verifier
-        # Simple in-memory cache for model generations (prompt-level)
+        if waveform_comparator is None:
+            from waveform_analyzer import WaveformComparator
+            waveform_comparator = WaveformComparator()
+        self.waveform_comparator = waveform_comparator
+        # In-memory LRU cache for model generations (prompt-level), bounded
+        # by GENERATION_CACHE_MAX_ENTRIES when one evaluator serves many tasks
         # Key: (model_name, task_id, tier, attempt, prompt_hash)
         # Value: (generated_code, gen_time)
-        self.generation_cache: Dict[Tuple[str, str, int, int, str], Tuple[str, float]] = {}
+        self.generation_cache: "OrderedDict[Tuple[str, str, int, int, str], Tuple[str, float]]" = OrderedDict()
+        # Optional cache shared across evaluators (and runs, if persisted),
+        # keyed on (model_name, prompt digest) so identical prompts from any
+        # task, repetition or attempt reuse one generation
+        self.prompt_cache = prompt_cache
+        # Reference waveforms per (task, reference HDL/TB mtimes):
+        # futures of (ref_vcd_path, parsed ref_vcd)
+        self._ref_vcd_cache: Dict[Tuple[str, int, int], Future] = {}
+        # Scores of the most recent attempts, for the no-improvement stop
+        if config.STOPPING_METHOD == "slope":
+            window_size = max(config.SLOPE_WINDOW, 3)
+        else:
+            window_size = max(config.NO_IMPROVEMENT_WINDOW, 2)
+        self._score_window: deque = deque(maxlen=window_size)
+        # Bias-corrected EMA of the score slope: (raw average, update count)
+        self._slope_ema = (0.0, 0)
+    
+    def _draw_confidence_samples(
+        self,
+        model: Any,
+        prompt: str,
+        primary: str,
+        count: int,
+        post_process_func: Optional[callable] = None,
+    ) -> List[str]:
+        """
+        Draw extra generations for entropy estimation
+        
+        Models exposing generate_hdl_batch (HuggingFace) draw all samples in
+        one batched call. Otherwise samples are requested concurrently when
+        PARALLEL_CONFIDENCE_SAMPLES is set and the model declares
+        thread_safe = True (e.g. HTTP-backed models), or one after another.
+        
+        With CONFIDENCE_EARLY_STOP_THRESHOLD set, sampling stops once
+        CONFIDENCE_MIN_SAMPLES generations are in hand and they agree closely
+        enough (ConfidenceTracker.distinct_fraction below the threshold).
+        Concurrent sampling checks this once, after the minimum batch.
+        
+        Args:
+            model: Model interface for generation
+            prompt: Prompt used for the primary generation
+            primary: Post-processed primary generation
+            count: Maximum number of additional samples
+            post_process_func: Optional post-processing function
+            
+        Returns:
+            Post-processed samples (failed samples are skipped)
+        """
+        from confidence_tracker import ConfidenceTracker
+        
+        def sample() -> str:
+            # Use slightly higher temperature for sampling
+            try:
+                sample_code, _ = model.generate_hdl(prompt, temperature=0.3)
+            except TypeError:
+                sample_code, _ = model.generate_hdl(prompt)
+            if post_process_func:
+                sample_code = post_process_func(sample_code)
+            return sample_code
+        
+        stop_threshold = self.config.CONFIDENCE_EARLY_STOP_THRESHOLD
+        min_samples = max(self.config.CONFIDENCE_MIN_SAMPLES, 2)
+        
+        def agreed(samples: List[str]) -> bool:
+            return (
+                stop_threshold is not None
+                and len(samples) + 1 >= min_samples
+                and ConfidenceTracker.distinct_fraction([primary, *samples]) < stop_threshold
+            )
+        
+        if count > 1 and hasattr(model, "generate_hdl_batch"):
+            try:
+                batch, _ = model.generate_hdl_batch(prompt, count, temperature=0.3)
+            except Exception:
+                batch = []
+            if batch:
+                if post_process_func:
+                    batch = [post_process_func(code) for code in batch]
+                return batch
+        
+        samples: List[str] = []
+        if (
+            count > 1
+            and self.config.PARALLEL_CONFIDENCE_SAMPLES
+            and getattr(model, "thread_safe", False)
+        ):
+            def draw_batch(n: int) -> None:
+                with ThreadPoolExecutor(max_workers=n) as pool:
+                    futures = [pool.submit(sample) for _ in range(n)]
+                    for future in as_completed(futures):
+                        try:
+                            samples.append(future.result())
+                        except Exception:
+                            # If sampling fails, just use the original
+                            pass
+            
+            first = count if stop_threshold is None else min(min_samples - 1, count)
+            draw_batch(first)
+            if first < count and not agreed(samples):
+                draw_batch(count - first)
+            return samples
+        
+        for _ in range(count):
+            try:
+                samples.append(sample())
+            except Exception:
+                # If sampling fails, just use the original
+                continue
+            if agreed(samples):
+                break
+        return samples
+    
+    def _build_reference_vcd(
+        self,
+        ref_tb_path: Path,
+        ref_hdl_path: Path,
+        ref_dir: Path,
+    ) -> Tuple[Optional[Path], Optional[Dict]]:
+        """
+        Simulate the reference design once and parse its waveform
+        
+        Args:
+            ref_tb_path: Reference testbench
+            ref_hdl_path: Reference HDL
+            ref_dir: Directory for the reference simulation artifacts
+            
+        Returns:
+            Tuple of (ref_vcd_path, parsed ref_vcd), with None for whichever
+            could not be produced
+        """
+        ref_dir.mkdir(exist_ok=True)
+        ref_tb_with_vcd = ref_dir / "ref_tb_with_vcd.v"
+        if not self.waveform_analyzer.inject_vcd_dump(ref_tb_path, ref_tb_with_vcd):
+            return None, None
+        ref_vcd_path = self.waveform_analyzer.generate_vcd(
+            ref_tb_with_vcd, ref_hdl_path, ref_dir
+        )
+        if not (ref_vcd_path and ref_vcd_path.exists()):
+            return None, None
+        return ref_vcd_path, self.waveform_analyzer.load_vcd(ref_vcd_path)
+    
+    def _reference_vcd_future(
+        self,
+        task: BenchmarkTask,
+        ref_tb_path: Path,
+        ref_hdl_path: Path,
+        output_dir: Path,
+    ) -> Future:
+        """Start (or reuse) the background reference simulation for a task"""
+        # Editing either reference file invalidates the cached waveform
+        key = (task.task_id, ref_hdl_path.stat().st_mtime_ns, ref_tb_path.stat().st_mtime_ns)
+        future = self._ref_vcd_cache.get(key)
+        if future is None:
+            pool = ThreadPoolExecutor(max_workers=1)
+            future = pool.submit(
+                self._build_reference_vcd,
+                ref_tb_path, ref_hdl_path, output_dir / "reference",
+            )
+            # Let the worker exit once the job is done
+            pool.shutdown(wait=False)
+            self._ref_vcd_cache[key] = future
+        return future
+    
+    @classmethod
+    def evaluate_tasks_parallel(
+        cls,
+        jobs: List[Tuple[BenchmarkTask, Path, Dict[str, Any]]],
+        model: Any,
+        evaluator_kwargs: Dict[str, Any],
+        max_workers: Optional[int] = None,
+    ) -> List[Future]:
+        """
+        Run independent tasks concurrently, one fresh evaluator per job
+        
+        Workers are threads rather than processes: model interfaces hold
+        HTTP sessions or GPU weights that cannot be pickled, and the
+        per-attempt work (model calls, compiler and simulator
+        subprocesses) releases the GIL. Models without thread_safe = True
+        are run one job at a time.
+        
+        Args:
+            jobs: (task, output_dir, evaluate_with_refinement kwargs) per job
+            model: Model interface shared by all jobs
+            evaluator_kwargs: Constructor arguments for each evaluator
+                              (config, compiler, simulator, ...)
+            max_workers: Concurrent jobs (defaults to config.MAX_WORKERS,
+                         else half the CPU count)
+            
+        Returns:
+            Futures of (best_metrics, iteration_history), in job order
+        """
+        config = evaluator_kwargs["config"]
+        if not getattr(model, "thread_safe", False):
+            max_workers = 1
+        elif max_workers is None:
+            max_workers = config.MAX_WORKERS or max(1, (os.cpu_count() or 2) // 2)
+        
+        def run(task: BenchmarkTask, output_dir: Path, kwargs: Dict[str, Any]):
+            # Evaluators keep per-task state, so each job gets its own
+            return cls(**evaluator_kwargs).evaluate_with_refinement(
+                task, model, output_dir, **kwargs
+            )
+        
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        futures = [pool.submit(run, *job) for job in jobs]
+        # Queued jobs keep running; the workers exit once they are done
+        pool.shutdown(wait=False)
+        return futures
     
     def evaluate_with_refinement(
         self,
@@ -69,8 +308,8 @@ class IterativeEvaluator:
         """
         iteration_history: List[Dict] = []
         best_result = None
-        best_score = -1
-        start_time = time.time()
+        best_key = None
+        start_ns = time.perf_counter_ns()
         
         # Resolve per-run configuration
         max_iters = max_iterations or self.config.MAX_ITERATIONS
@@ -88,34 +327,77 @@ class IterativeEvaluator:
         
         original_spec = task.spec
         feedback = ""
+        last_feedback_inputs = None
+        self._score_window.clear()
+        self._slope_ema = (0.0, 0)
         module_name = extract_module_name(task.task_id)
+        # Constrained prompt from Phase 2, built once per task
+        base_prompt = get_constrained_prompt(original_spec, module_name)
+        # Reference paths are fixed for the task; resolve them once
+        ref_hdl_path = Path(task.reference_hdl) if task.reference_hdl else None
+        ref_tb_path = Path(task.reference_tb) if task.reference_tb else None
+        ref_hdl_exists = ref_hdl_path.exists() if ref_hdl_path else False
         
+        # The reference waveform depends only on the task: simulate it in the
+        # background while the first generation and compile run
+        ref_vcd_future: Optional[Future] = None
+        ref_clock = ref_reset = None
+        if self.waveform_analyzer and waveform_enabled and ref_hdl_exists and ref_tb_path and ref_tb_path.exists():
+            ref_vcd_future = self._reference_vcd_future(
+                task, ref_tb_path, ref_hdl_path, output_dir
+            )
+            # Both dumps are rooted at the testbench's top module
+            ref_clock, ref_reset = self.waveform_comparator.signals_from_testbench(ref_tb_path)
+        
+        # Compile/simulation outcomes by generated-code digest: the model
+        # often returns identical code for different feedback prompts
+        compile_memo: Dict[str, Tuple[bool, List[str]]] = {}
+        sim_memo: Dict[str, Tuple[bool, int, int, Optional[Path]]] = {}
+        
+        last_prompt = None
         for attempt in range(1, max_iters + 1):
-            attempt_dir = output_dir / f"attempt_{attempt}"
-            attempt_dir.mkdir(exist_ok=True)
+            # A fully passing attempt cannot be beaten, even when adaptive
+            # stopping is off; skip the remaining model calls
+            if best_result is not None and best_result.syntax_valid and best_result.simulation_passed:
+                break
             
             # Generate code with feedback
             if attempt == 1:
-                # Use constrained prompt from Phase 2
-                prompt = get_constrained_prompt(original_spec, module_name)
+                prompt = base_prompt
             else:
                 # Add feedback to constrained prompt for iterative refinement
-                base_prompt = get_constrained_prompt(original_spec, module_name)
-                prompt = f"{base_prompt}\n\n---\nFEEDBACK FROM PREVIOUS ATTEMPT:\n{feedback}\n\nPlease address the issues above and regenerate the Verilog code."
+                prompt = "".join((base_prompt, _FEEDBACK_PREAMBLE, feedback, _FEEDBACK_EPILOGUE))
+            
+            # The primary generation is greedy (temperature 0.0), so an
+            # unchanged prompt would only replay the previous attempt
+            if prompt == last_prompt:
+                break
+            last_prompt = prompt
+            
+            attempt_dir = output_dir / f"attempt_{attempt}"
+            attempt_dir.mkdir(exist_ok=True)
             
             # Generate HDL (with optional caching)
             # For Phase 4, we pass the full prompt directly (Phase 2 style)
             # The model interface will still add its template, but the constrained prompt
             # from Phase 2 is more complete, so we pass it as specification
             model_name = getattr(model, "model_name", "unknown")
-            prompt_key = prompt.encode("utf-8", errors="ignore")
-            prompt_hash = str(hash(prompt_key))
+            # Stable BLAKE2b digest (hash() is salted per process)
+            prompt_hash = GenerationCache.spec_digest(prompt)
             cache_key = (model_name, task.task_id, task_tier, attempt, prompt_hash)
             
-            if self.config.ENABLE_GENERATION_CACHE and cache_key in self.generation_cache:
+            shared_code = (
+                self.prompt_cache.get(model_name, prompt)
+                if self.config.ENABLE_GENERATION_CACHE and self.prompt_cache is not None
+                else None
+            )
+            if shared_code is not None:
+                generated_code, gen_time = shared_code, 0.0
+            elif self.config.ENABLE_GENERATION_CACHE and cache_key in self.generation_cache:
                 generated_code, gen_time = self.generation_cache[cache_key]
+                self.generation_cache.move_to_end(cache_key)
             else:
-                gen_start = time.time()
+                gen_start = time.perf_counter_ns()
                 if hasattr(model, "generate_hdl"):
                     try:
                         # Pass prompt as specification (model will add its own template)
@@ -125,10 +407,16 @@ class IterativeEvaluator:
                     except TypeError:
                         generated_code, gen_time = model.generate_hdl(prompt)
                 else:
-                    generated_code, gen_time = "", 0.0
-                gen_time = time.time() - gen_start
+                    generated_code, gen_time = "", None
+                if gen_time is None:
+                    # Model did not time itself: fall back to wall clock
+                    gen_time = (time.perf_counter_ns() - gen_start) * 1e-9
                 if self.config.ENABLE_GENERATION_CACHE:
                     self.generation_cache[cache_key] = (generated_code, gen_time)
+                    if len(self.generation_cache) > self.config.GENERATION_CACHE_MAX_ENTRIES:
+                        self.generation_cache.popitem(last=False)
+                    if self.prompt_cache is not None:
+                        self.prompt_cache.put(model_name, prompt, generated_code)
             
             # Post-process if function provided
             if post_process_func:
@@ -136,40 +424,45 @@ class IterativeEvaluator:
             
             # Save generated code
             hdl_file = attempt_dir / f"{task.task_id}.v"
-            hdl_file.write_text(generated_code)
+            hdl_file.write_bytes(generated_code.encode("utf-8"))
+            
+            # Extra confidence samples do not depend on the compile result:
+            # draw them in the background while the compiler runs
+            track_confidence = self.confidence_tracker and self.config.CONFIDENCE_TRACKING
+            samples_future: Optional[Future] = None
+            if track_confidence and self.config.CONFIDENCE_SAMPLES > 1:
+                sampler = ThreadPoolExecutor(max_workers=1)
+                samples_future = sampler.submit(
+                    self._draw_confidence_samples,
+                    model, prompt, generated_code,
+                    self.config.CONFIDENCE_SAMPLES - 1, post_process_func,
+                )
+                sampler.shutdown(wait=False)
+            
+            # Compile (reused when an earlier attempt produced the same code)
+            code_digest = GenerationCache.spec_digest(generated_code)
+            compile_time = 0.0
+            if code_digest in compile_memo:
+                syntax_valid, compile_errors = compile_memo[code_digest]
+            else:
+                compile_start = time.perf_counter_ns()
+                syntax_valid, compile_errors = self.compiler.compile(hdl_file, attempt_dir)
+                compile_time = (time.perf_counter_ns() - compile_start) * 1e-9
+                compile_memo[code_digest] = (syntax_valid, compile_errors)
             
             # Confidence tracking (computed before simulation to allow entropy gating)
             confidence_metrics: Dict[str, Any] = {}
             entropy = None
-            if self.confidence_tracker and self.config.CONFIDENCE_TRACKING:
+            if track_confidence:
                 generations = [generated_code]
-                if self.config.CONFIDENCE_SAMPLES > 1:
-                    # Use slightly higher temperature for sampling
-                    for _ in range(self.config.CONFIDENCE_SAMPLES - 1):
-                        try:
-                            try:
-                                sample_code, _ = model.generate_hdl(
-                                    prompt, temperature=0.3
-                                )
-                            except TypeError:
-                                sample_code, _ = model.generate_hdl(prompt)
-                            if post_process_func:
-                                sample_code = post_process_func(sample_code)
-                            generations.append(sample_code)
-                        except Exception:
-                            # If sampling fails, just use the original
-                            pass
+                if samples_future is not None:
+                    generations.extend(samples_future.result())
                 entropy = self.confidence_tracker.compute_entropy(generations)
                 confidence_metrics = {
                     "entropy": entropy,
                     "log_prob": None,  # Would need model API support
                 }
             
-            # Compile
-            compile_start = time.time()
-            syntax_valid, compile_errors = self.compiler.compile(hdl_file, attempt_dir)
-            compile_time = time.time() - compile_start
-            
             # Decide whether to run simulation based on entropy gating
             fast_skip_reason: Optional[str] = None
             high_entropy = (
@@ -178,64 +471,54 @@ class IterativeEvaluator:
                 and entropy > self.config.ENTROPY_THRESHOLD
             )
             
-            # Formal verification (optional – only when enabled and syntax is valid)
-            equiv_report = None
-            if (
-                self.formal_verifier
-                and formal_enabled
-                and syntax_valid
-            ):
-                ref_hdl = Path(task.reference_hdl) if task.reference_hdl else None
-                if ref_hdl and ref_hdl.exists():
-                    equiv_report = self.formal_verifier.equiv_check(
-                        ref_hdl, hdl_file, attempt_dir
-                    )
-            
             # Simulate
             sim_passed = False
             tests_passed = 0
             tests_total = 0
             sim_time = 0.0
+            fully_passed = False
             waveform_diff = None
+            waveform_summary = None
             
             run_simulation = (
                 syntax_valid
-                and task.reference_tb
+                and ref_tb_path
                 and not high_entropy
             )
             if high_entropy:
                 fast_skip_reason = "entropy_high"
             
             if run_simulation:
-                sim_start = time.time()
-                sim_passed, tests_passed, tests_total, vcd_path_result = (
-                    self.simulator.simulate(
-                        hdl_file,
-                        Path(task.reference_tb),
-                        attempt_dir,
-                        generate_vcd=waveform_enabled,
+                if code_digest in sim_memo:
+                    # The reused VCD stays in the earlier attempt's directory
+                    sim_passed, tests_passed, tests_total, vcd_path_result = sim_memo[code_digest]
+                else:
+                    sim_start = time.perf_counter_ns()
+                    sim_passed, tests_passed, tests_total, vcd_path_result = (
+                        self.simulator.simulate(
+                            hdl_file,
+                            ref_tb_path,
+                            attempt_dir,
+                            generate_vcd=waveform_enabled,
+                        )
                     )
-                )
-                sim_time = time.time() - sim_start
+                    sim_time = (time.perf_counter_ns() - sim_start) * 1e-9
+                    sim_memo[code_digest] = (sim_passed, tests_passed, tests_total, vcd_path_result)
+                fully_passed = sim_passed and tests_passed == tests_total
                 
-                # Compare waveforms if available
-                if (
-                    vcd_path_result
-                    and self.waveform_analyzer
-                    and task.reference_hdl
-                    and waveform_enabled
-                ):
-                    ref_hdl = Path(task.reference_hdl)
-                    ref_tb = Path(task.reference_tb)
-                    ref_tb_with_vcd = attempt_dir / "ref_tb_with_vcd.v"
+                # Compare waveforms if available (nothing to diagnose when
+                # every test already passed)
+                if vcd_path_result and ref_vcd_future is not None and not fully_passed:
+                    ref_vcd_path, ref_vcd = ref_vcd_future.result()
                     
-                    if self.waveform_analyzer.inject_vcd_dump(ref_tb, ref_tb_with_vcd):
-                        ref_vcd_path = self.waveform_analyzer.generate_vcd(
-                            ref_tb_with_vcd, ref_hdl, attempt_dir
+                    if ref_vcd_path:
+                        # vcddiff screens the pair natively; the Python diff
+                        # only runs when they diverge (or vcddiff is
+                        # unavailable) to build per-signal repair hints
+                        waveform_summary = self.waveform_comparator.compare(
+                            ref_vcd_path, vcd_path_result, ref_clock, ref_reset
                         )
-                        
-                        if ref_vcd_path and ref_vcd_path.exists():
-                            ref_vcd = self.waveform_analyzer.load_vcd(ref_vcd_path)
+                        if waveform_summary != "":
                             gen_vcd = self.waveform_analyzer.load_vcd(vcd_path_result)
                             if ref_vcd and gen_vcd:
                                 waveform_diff = (
@@ -244,9 +527,23 @@ class IterativeEvaluator:
                                     )
                                 )
             
-            # Semantic analysis
+            # Formal verification (optional – only when enabled, syntax is
+            # valid, and simulation has not already shown the design correct)
+            equiv_report = None
+            if (
+                self.formal_verifier
+                and formal_enabled
+                and syntax_valid
+                and ref_hdl_exists
+                and not fully_passed
+            ):
+                equiv_report = self.formal_verifier.equiv_check(
+                    ref_hdl_path, hdl_file, attempt_dir
+                )
+            
+            # Semantic analysis (only needed to repair a failed attempt)
             repair_hints: List[str] = []
-            if self.semantic_repair:
+            if self.semantic_repair and not (syntax_valid and sim_passed):
                 analysis = self.semantic_repair.analyze_failure(
                     compile_errors,
                     [] if sim_passed else ["Simulation failed"],
@@ -289,7 +586,10 @@ class IterativeEvaluator:
                 confidence_entropy=confidence_metrics.get("entropy")
                 if confidence_metrics
                 else None,
-                waveform_diff_summary=str(waveform_diff) if waveform_diff else None,
+                waveform_diff_summary=(
+                    waveform_summary
+                    or (str(waveform_diff) if waveform_diff else None)
+                ),
                 formal_equiv_status=equiv_report.get("status") if equiv_report else None,
                 semantic_repair_applied=repair_hints,
                 fast_skip_reason=fast_skip_reason,
@@ -297,19 +597,25 @@ class IterativeEvaluator:
             
             # Score this attempt
             score = self._score_attempt(metrics)
-            if score > best_score:
-                best_score = score
-                best_result = metrics
-            
-            iteration_history.append({
+            entry = {
                 "attempt": attempt,
                 "metrics": metrics,
                 "score": score,
                 "feedback": feedback
-            })
+            }
+            key = _selection_key(entry)
+            if best_key is None or key > best_key:
+                best_key = key
+                best_result = metrics
             
-            # Generate feedback for next iteration
-            if not (syntax_valid and sim_passed):
+            iteration_history.append(entry)
+            self._score_window.append(score)
+            
+            # Generate feedback for next iteration (reused as-is when the
+            # attempt failed the same way as the previous one)
+            feedback_inputs = (compile_errors, sim_passed, waveform_diff, repair_hints)
+            if not (syntax_valid and sim_passed) and feedback_inputs != last_feedback_inputs:
+                last_feedback_inputs = feedback_inputs
                 compile_fb = self.feedback_generator.compile_feedback(compile_errors)
                 sim_fb = self.feedback_generator.simulation_feedback(
                     [] if sim_passed else ["Tests failed"],
@@ -323,7 +629,7 @@ class IterativeEvaluator:
             # Per-task wall-clock timeout
             if (
                 self.config.TASK_MAX_RUNTIME_SECONDS
-                and (time.time() - start_time) > self.config.TASK_MAX_RUNTIME_SECONDS
+                and (time.perf_counter_ns() - start_ns) * 1e-9 > self.config.TASK_MAX_RUNTIME_SECONDS
             ):
                 if not fast_skip_reason:
                     metrics.fast_skip_reason = "timeout"
@@ -337,21 +643,15 @@ class IterativeEvaluator:
     
     def _score_attempt(self, metrics: EvaluationMetrics) -> float:
         """Score an attempt based on syntax, simulation, and confidence"""
-        score = 0.0
-        
-        if metrics.syntax_valid:
-            score += 1.0
-        
-        if metrics.simulation_passed:
-            score += 2.0
-            if metrics.test_cases_total > 0:
-                score += (metrics.test_cases_passed / metrics.test_cases_total)
-        
-        # Confidence bonus (lower entropy = higher confidence = better)
-        if metrics.confidence_entropy is not None:
-            score += (1.0 - metrics.confidence_entropy) * 0.5
-        
-        return score
+        # Booleans act as 0/1 weights: syntax (1) + simulation (2 + pass ratio)
+        # + confidence bonus (lower entropy = higher confidence = better)
+        sim = float(metrics.simulation_passed)
+        entropy = metrics.confidence_entropy
+        return (
+            float(metrics.syntax_valid)
+            + sim * (2.0 + metrics.test_cases_passed / max(metrics.test_cases_total, 1))
+            + (1.0 - (entropy or 0.0)) * 0.5 * (entropy is not None)
+        )
     
     def should_continue(
         self,
@@ -381,18 +681,56 @@ class IterativeEvaluator:
             if last_metrics.syntax_valid and last_metrics.simulation_passed:
                 return False
         
-        # Stop if no improvement in last 2 attempts
-        if len(results_history) >= 2:
-            last_two = results_history[-2:]
-            scores = [r["score"] for r in last_two]
-            
-            if len(scores) == 2:
-                improvement = scores[1] - scores[0]
-                if improvement < self.config.MIN_IMPROVEMENT_THRESHOLD:
-                    return False
+        if self.config.STOPPING_METHOD == "slope":
+            # Stop once the recent scores are flat and show no trend
+            return not self._scores_converged()
+        
+        # Stop if no attempt in the last NO_IMPROVEMENT_WINDOW improved on
+        # the window's first score by the threshold
+        window = self._score_window
+        if len(window) == window.maxlen:
+            if max(window) - window[0] < self.config.MIN_IMPROVEMENT_THRESHOLD:
+                return False
         
         return True
     
+    def _scores_converged(self) -> bool:
+        """
+        Fit a line through the recent scores and test for convergence
+        
+        The slope is smoothed with a bias-corrected EMA across attempts so
+        a single noisy score does not decide the stop.
+        
+        Returns:
+            True if the smoothed slope is below MIN_IMPROVEMENT_THRESHOLD
+            and the fit's R² is below SLOPE_R2_THRESHOLD
+        """
+        scores = self._score_window
+        n = len(scores)
+        if n < 3:
+            return False
+        
+        x_mean = (n - 1) / 2
+        y_mean = sum(scores) / n
+        sxx = sum((x - x_mean) ** 2 for x in range(n))
+        sxy = sum((x - x_mean) * (y - y_mean) for x, y in enumerate(scores))
+        syy = sum((y - y_mean) ** 2 for y in scores)
+        slope = sxy / sxx
+        # Constant scores have no trend at all
+        r2 = sxy * sxy / (sxx * syy) if syy > 0 else 0.0
+        
+        decay = self.config.SLOPE_EMA_DECAY
+        ema, updates = self._slope_ema
+        ema = decay * ema + (1.0 - decay) * slope
+        updates += 1
+        self._slope_ema = (ema, updates)
+        smoothed = ema / (1.0 - decay ** updates)
+        
+        return (
+            abs(smoothed) < self.config.MIN_IMPROVEMENT_THRESHOLD
+            and r2 < self.config.SLOPE_R2_THRESHOLD
+        )
+    
     def select_best_result(
         self,
         results_history: List[Dict]
@@ -400,6 +738,9 @@ class IterativeEvaluator:
         """
         Choose best result based on syntax, simulation, and confidence
         
+        Passing attempts rank above failing ones and are compared by their
+        CISC score; failing attempts are compared by their additive score.
+        
         Args:
             results_history: History of all attempts
             
@@ -409,12 +750,6 @@ class IterativeEvaluator:
         if not results_history:
             return None
         
-        # Sort by score (highest first)
-        sorted_results = sorted(
-            results_history,
-            key=lambda x: x["score"],
-            reverse=True
-        )
-        
-        return sorted_results[0]["metrics"]
+        # Highest key wins; max keeps the earliest attempt on ties
+        return max(results_history, key=_selection_key)["metrics"]
 
@@ -3,16 +3,143 @@ AI Model Interface for HDL Generation
 Supports Ollama (local) and HuggingFace Transformers
 """
 
+import hashlib
+import importlib.util
 import json
 import os
+import sqlite3
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict, Tuple, List
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Request/stream (de)serialization, using orjson when available; both
+# work on UTF-8 bytes so streamed lines are parsed without a str decode
+_json_dumps = orjson.dumps if ORJSON_AVAILABLE else (lambda obj: json.dumps(obj).encode("utf-8"))
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# huggingface_hub reads HF_HUB_ENABLE_HF_TRANSFER once, when it is first
+# imported (directly or via transformers), so the flag is set here rather
+# than at download time
+HF_TRANSFER_AVAILABLE = importlib.util.find_spec("hf_transfer") is not None
+if HF_TRANSFER_AVAILABLE:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+# Prompt templates as (text before, text after) the specification
+PROMPT_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    # A: Minimal natural-language specification
+    "A": (
+        "",
+        """
+
+Write only the Verilog module code. Do not include explanations.""",
+    ),
+    # B: Specification + explicit requirements
+    "B": (
+        """Write synthesizable Verilog code for the following specification:
+
+""",
+        """
+
+Requirements:
+- Use proper Verilog-2001 syntax
+- Include complete module declaration with all ports
+- Make the design synthesizable (no delays, no initial blocks in synthesis)
+- Add brief comments for clarity
+- Use descriptive signal names
+
+Provide only the Verilog code:""",
+    ),
+    # C: Detailed with examples
+    "C": (
+        """Design and implement in Verilog:
+
+""",
+        """
+
+Guidelines:
+- Follow standard RTL design practices
+- Use blocking assignments (=) for combinational logic
+- Use non-blocking assignments (<=) for sequential logic
+- Include reset logic for sequential elements
+- Test your logic mentally before writing
+
+Verilog module:""",
+    ),
+}
+
+
+class ResponseCache:
+    """
+    On-disk cache of greedy (temperature 0) generations in SQLite
+    
+    Enabled by setting MODEL_RESPONSE_CACHE_DIR; sampled generations are
+    never cached so confidence sampling keeps drawing fresh outputs.
+    """
+    
+    def __init__(self, cache_dir: Path):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(cache_dir / "responses.sqlite"), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, code TEXT, gen_time REAL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_env(cls) -> Optional["ResponseCache"]:
+        """Cache in $MODEL_RESPONSE_CACHE_DIR, or None when unset"""
+        cache_dir = os.getenv("MODEL_RESPONSE_CACHE_DIR")
+        return cls(Path(cache_dir)) if cache_dir else None
+    
+    @staticmethod
+    def key(model_name: str, prompt: str, temperature: float, max_tokens: int, backend: str = "") -> str:
+        """
+        Cache key for one generation request
+        
+        Args:
+            backend: Interface class plus weight precision (e.g.
+                     "HuggingFaceInterface:4bit"); the same model name under
+                     another backend or quantization gives different outputs
+        """
+        payload = json.dumps(
+            {"m": model_name, "p": prompt, "t": temperature, "n": max_tokens, "b": backend},
+            sort_keys=True
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT code, gen_time FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+    
+    def put(self, key: str, code: str, gen_time: float):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, code, gen_time)
+            )
+            self._conn.commit()
+
+
 class OllamaInterface:
     """Interface for Ollama local models (Llama3, TinyLlama, etc.)"""
     
+    # Each generate_hdl call is an independent HTTP request
+    thread_safe = True
+    
     def __init__(self, model_name: str, base_url: Optional[str] = None):
         """
         Initialize Ollama interface
@@ -30,12 +157,28 @@ class OllamaInterface:
             self.base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         else:
             self.base_url = base_url
+        self._response_cache = ResponseCache.from_env()
+        self._cache_backend = type(self).__name__
+        # One pooled session keeps connections to Ollama alive across calls;
+        # the pool is sized for concurrent confidence samples and tasks
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self._verify_connection()
     
+    def close(self):
+        """Release pooled connections"""
+        self._session.close()
+    
     def _verify_connection(self):
         """Check if Ollama is running"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 available = [m['name'] for m in models]
@@ -71,30 +214,40 @@ class OllamaInterface:
         """
         prompt = self._construct_prompt(specification, prompt_template)
         
+        cache_key = None
+        if self._response_cache is not None and temperature == 0:
+            cache_key = ResponseCache.key(self.model_name, prompt, temperature, max_tokens, self._cache_backend)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         start_time = time.time()
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/generate",
-                json={
+                data=_json_dumps({
                     "model": self.model_name,
                     "prompt": prompt,
                     "temperature": temperature,
-                    "stream": False,
+                    "stream": True,
                     "options": {
                         "num_predict": max_tokens
                     }
-                },
-                timeout=120  # 2 minute timeout
+                }),
+                headers={"Content-Type": "application/json"},
+                timeout=120,  # 2 minute timeout
+                stream=True
             )
             
             if response.status_code == 200:
-                result = response.json()
-                generated_code = result.get('response', '')
+                generated_code = self._read_stream(response, start_time + 120)
                 generation_time = time.time() - start_time
                 
                 # Extract just the Verilog code
                 code = self._extract_verilog_code(generated_code)
+                if cache_key is not None:
+                    self._response_cache.put(cache_key, code, generation_time)
                 return code, generation_time
             else:
                 print(f"Error: API returned {response.status_code}")
@@ -107,6 +260,77 @@ class OllamaInterface:
             print(f"Error during generation: {e}")
             return self._fallback_code(), time.time() - start_time
     
+    def generate_hdl_many(
+        self,
+        specifications: List[str],
+        prompt_template: str = "A",
+        temperature: float = 0.0,
+        max_tokens: int = 512,
+        concurrency: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Generate one design per specification with bounded concurrent requests
+        
+        Args:
+            specifications: Natural language descriptions of circuits
+            prompt_template: Template ID ('A', 'B', or 'C')
+            temperature: Sampling temperature (0.0 = deterministic)
+            max_tokens: Maximum tokens to generate per design
+            concurrency: Requests in flight at once (defaults to the
+                         OLLAMA_CONCURRENCY env var, else 8); the server
+                         queues beyond its own OLLAMA_NUM_PARALLEL
+            
+        Returns:
+            List of (generated_code, generation_time_seconds) in input order
+        """
+        if not specifications:
+            return []
+        if concurrency is None:
+            concurrency = int(os.getenv("OLLAMA_CONCURRENCY", "8"))
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(specifications)))) as pool:
+            return list(pool.map(
+                lambda spec: self.generate_hdl(spec, prompt_template, temperature, max_tokens),
+                specifications
+            ))
+    
+    def _read_stream(self, response: requests.Response, deadline: float) -> str:
+        """
+        Accumulate a streamed /api/generate completion
+        
+        _extract_verilog_code keeps only the first ```verilog fenced block,
+        so once that block has closed nothing later can change the result:
+        the connection is dropped there, which also stops Ollama generating.
+        
+        Args:
+            response: Streaming response of newline-delimited JSON chunks
+            deadline: time.time() after which the request counts as timed out
+            
+        Returns:
+            Completion text received so far
+        """
+        text = ""
+        body_start = -1
+        with response:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = _json_loads(line)
+                scanned = len(text)
+                text += chunk.get("response", "")
+                if chunk.get("done"):
+                    break
+                if time.time() > deadline:
+                    raise requests.exceptions.Timeout()
+                # Rescan a few characters back in case a fence spans chunks
+                if body_start < 0:
+                    fence = text.find("```verilog", max(0, scanned - 9))
+                    if fence >= 0:
+                        body_start = fence + len("```verilog")
+                if body_start >= 0 and text.find("```", max(body_start, scanned - 2)) != -1:
+                    break
+        return text
+    
     def generate_with_confidence(
         self,
         specification: str,
@@ -129,17 +353,21 @@ class OllamaInterface:
             Tuple of (code, gen_time, log_probs, entropy)
             log_probs may be None if not available
         """
-        # Generate primary sample
-        code, gen_time = self.generate_hdl(specification, prompt_template, temperature, max_tokens)
-        
-        # Generate additional samples for entropy (if temperature > 0)
-        samples = [code]
         if temperature > 0 and num_samples > 1:
-            for _ in range(num_samples - 1):
-                sample_code, _ = self.generate_hdl(
-                    specification, prompt_template, temperature, max_tokens
-                )
-                samples.append(sample_code)
+            # Samples are independent HTTP requests: issue them together so
+            # the wait is one round trip rather than num_samples of them
+            with ThreadPoolExecutor(max_workers=num_samples) as pool:
+                futures = [
+                    pool.submit(self.generate_hdl, specification, prompt_template, temperature, max_tokens)
+                    for _ in range(num_samples)
+                ]
+                results = [f.result() for f in futures]
+            # The first request is the primary sample
+            code, gen_time = results[0]
+            samples = [sample_code for sample_code, _ in results]
+        else:
+            code, gen_time = self.generate_hdl(specification, prompt_template, temperature, max_tokens)
+            samples = [code]
         
         # Compute entropy from samples
         from confidence_tracker import ConfidenceTracker
@@ -154,59 +382,28 @@ class OllamaInterface:
     
     def _construct_prompt(self, specification: str, template: str = "A") -> str:
         """Build prompt based on template type"""
-        
-        if template == "A":
-            # Minimal natural-language specification
-            prompt = f"""{specification}
-
-Write only the Verilog module code. Do not include explanations."""
-            
-        elif template == "B":
-            # Specification + explicit requirements
-            prompt = f"""Write synthesizable Verilog code for the following specification:
-
-{specification}
-
-Requirements:
-- Use proper Verilog-2001 syntax
-- Include complete module declaration with all ports
-- Make the design synthesizable (no delays, no initial blocks in synthesis)
-- Add brief comments for clarity
-- Use descriptive signal names
-
-Provide only the Verilog code:"""
-            
-        elif template == "C":
-            # Detailed with examples
-            prompt = f"""Design and implement in Verilog:
-
-{specification}
-
-Guidelines:
-- Follow standard RTL design practices
-- Use blocking assignments (=) for combinational logic
-- Use non-blocking assignments (<=) for sequential logic
-- Include reset logic for sequential elements
-- Test your logic mentally before writing
-
-Verilog module:"""
-        else:
-            prompt = specification
-        
-        return prompt
+        parts = PROMPT_TEMPLATES.get(template)
+        if parts is None:
+            return specification
+        prefix, suffix = parts
+        return prefix + specification + suffix
     
     def _extract_verilog_code(self, response: str) -> str:
         """Extract Verilog code from model response"""
         
+        # Each marker is located with a single find (no separate `in` test),
+        # and closing markers are searched only after their opener
         # Look for code blocks
-        if "```verilog" in response:
-            start = response.find("```verilog") + len("```verilog")
+        fence = response.find("```verilog")
+        if fence != -1:
+            start = fence + len("```verilog")
             end = response.find("```", start)
             if end != -1:
                 return response[start:end].strip()
         
-        if "```" in response:
-            start = response.find("```") + 3
+        fence = response.find("```")
+        if fence != -1:
+            start = fence + 3
             end = response.find("```", start)
             if end != -1:
                 code = response[start:end].strip()
@@ -216,8 +413,8 @@ Verilog module:"""
                 return code
         
         # Look for module declaration
-        if "module " in response:
-            start = response.find("module ")
+        start = response.find("module ")
+        if start != -1:
             # Find endmodule
             end = response.find("endmodule", start)
             if end != -1:
@@ -242,6 +439,9 @@ endmodule"""
 class HuggingFaceInterface:
     """Interface for HuggingFace Transformers (StarCoder2, etc.)"""
     
+    # One in-process model; concurrent generate() calls would contend for it
+    thread_safe = False
+    
     def __init__(self, model_name: str, device: str = "auto"):
         """
         Initialize HuggingFace model
@@ -252,10 +452,48 @@ class HuggingFaceInterface:
         """
         self.model_name = model_name
         self.device = device
+        self._response_cache = ResponseCache.from_env()
+        # Refined with the weight precision once the model is loaded
+        self._cache_backend = type(self).__name__
+        # Repetitions and refinement replays resend identical prompts
+        self._encode_prompt = lru_cache(maxsize=256)(self._tokenize_prompt)
         self.model = None
         self.tokenizer = None
         self._load_model()
     
+    def _prefetch_weights(self) -> str:
+        """
+        Download the model snapshot with parallel shard fetches
+        
+        Uses huggingface_hub.snapshot_download (multiple workers, and the
+        Rust hf_transfer backend when installed) so from_pretrained loads
+        from the local cache instead of pulling shards one at a time.
+        
+        Returns:
+            Local snapshot directory, or the model name if prefetch is
+            unavailable or fails (from_pretrained then downloads as before)
+        """
+        if Path(self.model_name).is_dir():
+            return self.model_name
+        try:
+            from huggingface_hub import list_repo_files, snapshot_download
+            
+            # Skip *.bin duplicates only when safetensors weights exist; repos
+            # with only *.bin weights are fetched in full. *.py keeps the
+            # custom modeling code needed by trust_remote_code
+            allow_patterns = None
+            if any(f.endswith(".safetensors") for f in list_repo_files(self.model_name)):
+                allow_patterns = ["*.safetensors", "*.json", "*.py", "tokenizer*", "*.model", "*.txt"]
+            
+            return snapshot_download(
+                self.model_name,
+                max_workers=8,
+                allow_patterns=allow_patterns
+            )
+        except Exception as e:
+            print(f"  ⚠ Parallel prefetch unavailable ({type(e).__name__}); downloading via from_pretrained")
+            return self.model_name
+    
     def _load_model(self):
         """Load model and tokenizer"""
         try:
@@ -282,13 +520,18 @@ class HuggingFaceInterface:
                     print(f"  ⚠ Attempting with AutoModelForCausalLM (may fail)")
                     print(f"  ⚠ Please upgrade: pip install --upgrade transformers>=4.35.0")
             
+            model_path = self._prefetch_weights()
+            
             # Load tokenizer first
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            self.tokenizer = AutoTokenizer.from_pretrained(model_path)
             
             # StarCoder2 and many code models need a pad_token - set it if missing
             if self.tokenizer.pad_token is None:
                 self.tokenizer.pad_token = self.tokenizer.eos_token
                 print(f"  Set pad_token to eos_token")
+            # Decoder-only models continue from the last position, so batched
+            # prompts (generate_hdl_many) must be padded on the left
+            self.tokenizer.padding_side = "left"
             
             # Determine device - on Mac, use CPU explicitly
             if self.device == "auto":
@@ -304,27 +547,60 @@ class HuggingFaceInterface:
             # Load model - use device_map only for CUDA, otherwise use standard device placement
             
             if device == "cuda":
-                self.model = model_class.from_pretrained(
-                    self.model_name,
-                    device_map="auto",
-                    torch_dtype=torch.float16,
-                    trust_remote_code=True
-                )
+                # bfloat16 keeps float32's exponent range (no fp16 overflow)
+                # at the same speed on GPUs that support it (Ampere and newer)
+                half_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                # HF_QUANT=4bit|8bit loads weights through bitsandbytes,
+                # cutting the bytes read per decoded token by 2-4x
+                quant = os.getenv("HF_QUANT", "").lower()
+                if quant in ("4bit", "8bit"):
+                    from transformers import BitsAndBytesConfig
+                    if quant == "4bit":
+                        quant_config = BitsAndBytesConfig(
+                            load_in_4bit=True,
+                            bnb_4bit_compute_dtype=half_dtype,
+                            bnb_4bit_quant_type="nf4",
+                            bnb_4bit_use_double_quant=True
+                        )
+                    else:
+                        quant_config = BitsAndBytesConfig(load_in_8bit=True)
+                    print(f"  Quantizing weights to {quant} (bitsandbytes)")
+                    precision = quant
+                    self.model = model_class.from_pretrained(
+                        model_path,
+                        device_map="auto",
+                        quantization_config=quant_config,
+                        trust_remote_code=True
+                    )
+                else:
+                    self.model = model_class.from_pretrained(
+                        model_path,
+                        device_map="auto",
+                        torch_dtype=half_dtype,
+                        trust_remote_code=True
+                    )
+                    precision = str(half_dtype)
+                if os.getenv("HF_COMPILE") == "1":
+                    self._compile_model()
             else:
                 # For CPU, load normally and move to CPU explicitly
                 self.model = model_class.from_pretrained(
-                    self.model_name,
+                    model_path,
                     torch_dtype=torch.float32,
                     trust_remote_code=True
                 )
                 self.model = self.model.to(device)
+                precision = str(torch.float32)
             
+            self._cache_backend = f"{type(self).__name__}:{precision}"
             print(f"✓ Model loaded successfully on {device}")
             
         except ImportError as e:
             print("⚠ transformers library not installed or missing StarCoder2 support")
             print(f"  Error: {e}")
             print("  Install: pip install --upgrade transformers>=4.35.0 torch accelerate")
+            if os.getenv("HF_QUANT"):
+                print("  HF_QUANT also requires: pip install bitsandbytes>=0.43")
             self.model = None
             self.tokenizer = None
         except Exception as e:
@@ -338,6 +614,34 @@ class HuggingFaceInterface:
             self.model = None
             self.tokenizer = None
     
+    def _tokenize_prompt(self, prompt: str) -> Dict:
+        """Token tensors for a full prompt (memoized per instance as _encode_prompt)"""
+        return dict(self.tokenizer(prompt, return_tensors="pt"))
+    
+    def _compile_model(self):
+        """Compile the forward pass over a static KV cache (HF_COMPILE=1)"""
+        import torch
+        
+        eager_forward = self.model.forward
+        try:
+            # A fixed-shape KV cache lets the compiled graph replay every
+            # decode step instead of dispatching each op from Python
+            self.model.generation_config.cache_implementation = "static"
+            self.model.forward = torch.compile(eager_forward, mode="reduce-overhead", fullgraph=False)
+            # Warm up so compilation is not charged to the first timed generation
+            warmup = self.tokenizer("module", return_tensors="pt").to(self.model.device)
+            self.model.generate(
+                **warmup,
+                max_new_tokens=2,
+                do_sample=False,
+                pad_token_id=self.tokenizer.pad_token_id or self.tokenizer.eos_token_id
+            )
+            print("  Compiled forward pass (torch.compile, static KV cache)")
+        except Exception as e:
+            print(f"  ⚠ torch.compile unavailable ({type(e).__name__}); using eager mode")
+            self.model.forward = eager_forward
+            self.model.generation_config.cache_implementation = None
+    
     def generate_hdl(
         self,
         specification: str,
@@ -353,10 +657,17 @@ class HuggingFaceInterface:
         
         prompt = self._construct_prompt(specification, prompt_template)
         
+        cache_key = None
+        if self._response_cache is not None and temperature == 0:
+            cache_key = ResponseCache.key(self.model_name, prompt, temperature, max_tokens, self._cache_backend)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         start_time = time.time()
         
         try:
-            inputs = self.tokenizer(prompt, return_tensors="pt")
+            inputs = self._encode_prompt(prompt)
             
             # Move inputs to model's device
             if hasattr(self.model, 'device'):
@@ -375,15 +686,18 @@ class HuggingFaceInterface:
                 pad_token_id=self.tokenizer.pad_token_id or self.tokenizer.eos_token_id
             )
             
-            generated_text = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-            
-            # Remove the prompt from output
-            if prompt in generated_text:
-                generated_text = generated_text[len(prompt):].strip()
+            # Decode only the new tokens; the prompt is the first
+            # input_ids.shape[1] positions of every output row
+            prompt_len = inputs["input_ids"].shape[1]
+            generated_text = self.tokenizer.decode(
+                outputs[0, prompt_len:], skip_special_tokens=True
+            ).strip()
             
             generation_time = time.time() - start_time
             
             code = self._extract_verilog_code(generated_text)
+            if cache_key is not None:
+                self._response_cache.put(cache_key, code, generation_time)
             return code, generation_time
             
         except Exception as e:
@@ -392,6 +706,305 @@ class HuggingFaceInterface:
             traceback.print_exc()
             return self._fallback_code(), time.time() - start_time
     
+    def generate_hdl_batch(
+        self,
+        specification: str,
+        n: int,
+        prompt_template: str = "A",
+        temperature: float = 0.3,
+        max_tokens: int = 512
+    ) -> Tuple[List[str], float]:
+        """
+        Sample n generations for one specification in a single generate() call
+        
+        The prompt is prefilled once and the n sequences decode as one batch
+        (num_return_sequences), instead of n separate generate_hdl calls.
+        
+        Args:
+            specification: Natural language description of circuit
+            n: Number of sequences to sample
+            prompt_template: Template ID ('A', 'B', or 'C')
+            temperature: Sampling temperature (must be > 0 for distinct samples)
+            max_tokens: Maximum tokens to generate per sequence
+            
+        Returns:
+            Tuple of (list of generated code strings, total generation time);
+            the list is empty if the model is not loaded or generation fails
+        """
+        if self.model is None or self.tokenizer is None or n < 1:
+            return [], 0.0
+        
+        prompt = self._construct_prompt(specification, prompt_template)
+        
+        start_time = time.time()
+        
+        try:
+            inputs = self._encode_prompt(prompt)
+            if hasattr(self.model, 'device'):
+                device = self.model.device
+            else:
+                device = next(self.model.parameters()).device
+            inputs = {k: v.to(device) for k, v in inputs.items()}
+            
+            outputs = self.model.generate(
+                **inputs,
+                max_new_tokens=max_tokens,
+                temperature=temperature if temperature > 0 else 0.1,
+                do_sample=True,
+                num_return_sequences=n,
+                pad_token_id=self.tokenizer.pad_token_id or self.tokenizer.eos_token_id
+            )
+            
+            # Decode only the new tokens of each sampled sequence
+            prompt_len = inputs["input_ids"].shape[1]
+            codes = [
+                self._extract_verilog_code(text.strip())
+                for text in self.tokenizer.batch_decode(outputs[:, prompt_len:], skip_special_tokens=True)
+            ]
+            return codes, time.time() - start_time
+            
+        except Exception as e:
+            print(f"Error during batched generation: {e}")
+            return [], time.time() - start_time
+    
+    def generate_hdl_many(
+        self,
+        specifications: List[str],
+        prompt_template: str = "A",
+        temperature: float = 0.0,
+        max_tokens: int = 512
+    ) -> List[Tuple[str, float]]:
+        """
+        Generate one design per specification in a single padded generate() call
+        
+        Args:
+            specifications: Natural language descriptions of circuits
+            prompt_template: Template ID ('A', 'B', or 'C')
+            temperature: Sampling temperature (0.0 = deterministic)
+            max_tokens: Maximum tokens to generate per design
+            
+        Returns:
+            List of (generated_code, generation_time_seconds) in input order;
+            the time is the batch time divided evenly across designs. Falls
+            back to fallback code for every entry if generation fails.
+        """
+        if not specifications:
+            return []
+        if self.model is None or self.tokenizer is None:
+            print("Model not loaded, using fallback")
+            return [(self._fallback_code(), 0.0)] * len(specifications)
+        
+        prompts = [self._construct_prompt(spec, prompt_template) for spec in specifications]
+        
+        start_time = time.time()
+        
+        try:
+            inputs = self.tokenizer(prompts, return_tensors="pt", padding=True)
+            if hasattr(self.model, 'device'):
+                device = self.model.device
+            else:
+                device = next(self.model.parameters()).device
+            inputs = {k: v.to(device) for k, v in inputs.items()}
+            
+            outputs = self.model.generate(
+                **inputs,
+                max_new_tokens=max_tokens,
+                temperature=temperature if temperature > 0 else 0.1,
+                do_sample=temperature > 0,
+                pad_token_id=self.tokenizer.pad_token_id or self.tokenizer.eos_token_id
+            )
+            
+            # With left padding every row's prompt ends at the same column,
+            # so the completions are everything after it
+            prompt_len = inputs["input_ids"].shape[1]
+            texts = self.tokenizer.batch_decode(outputs[:, prompt_len:], skip_special_tokens=True)
+            per_design = (time.time() - start_time) / len(prompts)
+            return [(self._extract_verilog_code(text.strip()), per_design) for text in texts]
+            
+        except Exception as e:
+            print(f"Error during batched generation: {e}")
+            return [(self._fallback_code(), time.time() - start_time)] * len(specifications)
+    
+    def _construct_prompt(self, specification: str, template: str = "A") -> str:
+        """Build prompt - same as Ollama interface"""
+        return OllamaInterface._construct_prompt(self, specification, template)
+    
+    def _extract_verilog_code(self, response: str) -> str:
+        """Extract Verilog code - same as Ollama interface"""
+        return OllamaInterface._extract_verilog_code(self, response)
+    
+    def _fallback_code(self) -> str:
+        """Return fallback code on error"""
+        return OllamaInterface._fallback_code(self)
+
+
+class VLLMInterface:
+    """
+    Interface for HuggingFace checkpoints served in-process by vLLM
+    
+    vLLM's paged KV cache and continuous batching give much higher
+    throughput than transformers' generate(), most visibly for the
+    multi-sample and multi-prompt calls. Engine sizing is read from
+    HDL_VLLM_DTYPE, HDL_VLLM_GPU_MEMORY_UTILIZATION, HDL_VLLM_MAX_MODEL_LEN,
+    HDL_VLLM_MAX_NUM_SEQS and HDL_VLLM_TENSOR_PARALLEL_SIZE.
+    """
+    
+    # One engine per process; its generate() is not re-entrant
+    thread_safe = False
+    
+    def __init__(self, model_name: str):
+        """
+        Initialize vLLM engine
+        
+        Args:
+            model_name: HF model path (e.g., 'bigcode/starcoder2-7b')
+        """
+        self.model_name = model_name
+        self.llm = None
+        self._response_cache = ResponseCache.from_env()
+        self._cache_backend = f"{type(self).__name__}:{os.getenv('HDL_VLLM_DTYPE', 'auto')}"
+        self._load_model()
+    
+    def _load_model(self):
+        """Start the vLLM engine"""
+        try:
+            from vllm import LLM
+            
+            print(f"Loading {self.model_name} with vLLM...")
+            engine_args = {
+                "dtype": os.getenv("HDL_VLLM_DTYPE", "auto"),
+                "gpu_memory_utilization": float(os.getenv("HDL_VLLM_GPU_MEMORY_UTILIZATION", "0.9")),
+                "tensor_parallel_size": int(os.getenv("HDL_VLLM_TENSOR_PARALLEL_SIZE", "1")),
+                "trust_remote_code": True,
+            }
+            if os.getenv("HDL_VLLM_MAX_MODEL_LEN"):
+                engine_args["max_model_len"] = int(os.environ["HDL_VLLM_MAX_MODEL_LEN"])
+            if os.getenv("HDL_VLLM_MAX_NUM_SEQS"):
+                engine_args["max_num_seqs"] = int(os.environ["HDL_VLLM_MAX_NUM_SEQS"])
+            self.llm = LLM(model=self.model_name, **engine_args)
+            print(f"✓ vLLM engine ready")
+            
+        except ImportError as e:
+            print("⚠ vllm not installed")
+            print(f"  Error: {e}")
+            print("  Install: pip install vllm")
+            self.llm = None
+        except Exception as e:
+            print(f"⚠ Error starting vLLM: {e}")
+            print(f"  Model: {self.model_name}")
+            self.llm = None
+    
+    def _sampling_params(self, temperature: float, max_tokens: int, n: int = 1):
+        from vllm import SamplingParams
+        return SamplingParams(n=n, temperature=temperature, max_tokens=max_tokens)
+    
+    def generate_hdl(
+        self,
+        specification: str,
+        prompt_template: str = "A",
+        temperature: float = 0.0,
+        max_tokens: int = 512
+    ) -> Tuple[str, float]:
+        """Generate Verilog HDL from specification"""
+        if self.llm is None:
+            print("Model not loaded, using fallback")
+            return self._fallback_code(), 0.0
+        
+        prompt = self._construct_prompt(specification, prompt_template)
+        
+        cache_key = None
+        if self._response_cache is not None and temperature == 0:
+            cache_key = ResponseCache.key(self.model_name, prompt, temperature, max_tokens, self._cache_backend)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        start_time = time.time()
+        
+        try:
+            output = self.llm.generate(
+                [prompt], self._sampling_params(temperature, max_tokens), use_tqdm=False
+            )[0]
+            generation_time = time.time() - start_time
+            
+            # vLLM returns only the completion, so no prompt stripping is needed
+            code = self._extract_verilog_code(output.outputs[0].text)
+            if cache_key is not None:
+                self._response_cache.put(cache_key, code, generation_time)
+            return code, generation_time
+            
+        except Exception as e:
+            print(f"Error during generation: {e}")
+            return self._fallback_code(), time.time() - start_time
+    
+    def generate_hdl_batch(
+        self,
+        specification: str,
+        n: int,
+        prompt_template: str = "A",
+        temperature: float = 0.3,
+        max_tokens: int = 512
+    ) -> Tuple[List[str], float]:
+        """
+        Sample n generations for one specification in a single request
+        
+        Returns:
+            Tuple of (list of generated code strings, total generation time);
+            the list is empty if the engine is not loaded or generation fails
+        """
+        if self.llm is None or n < 1:
+            return [], 0.0
+        
+        prompt = self._construct_prompt(specification, prompt_template)
+        
+        start_time = time.time()
+        
+        try:
+            output = self.llm.generate(
+                [prompt], self._sampling_params(temperature, max_tokens, n), use_tqdm=False
+            )[0]
+            codes = [self._extract_verilog_code(c.text) for c in output.outputs]
+            return codes, time.time() - start_time
+            
+        except Exception as e:
+            print(f"Error during batched generation: {e}")
+            return [], time.time() - start_time
+    
+    def generate_hdl_many(
+        self,
+        specifications: List[str],
+        prompt_template: str = "A",
+        temperature: float = 0.0,
+        max_tokens: int = 512
+    ) -> List[Tuple[str, float]]:
+        """
+        Generate one design per specification, continuously batched by vLLM
+        
+        Returns:
+            List of (generated_code, generation_time_seconds) in input order;
+            the time is the batch time divided evenly across designs
+        """
+        if not specifications:
+            return []
+        if self.llm is None:
+            print("Model not loaded, using fallback")
+            return [(self._fallback_code(), 0.0)] * len(specifications)
+        
+        prompts = [self._construct_prompt(spec, prompt_template) for spec in specifications]
+        
+        start_time = time.time()
+        
+        try:
+            outputs = self.llm.generate(
+                prompts, self._sampling_params(temperature, max_tokens), use_tqdm=False
+            )
+            per_design = (time.time() - start_time) / len(prompts)
+            return [(self._extract_verilog_code(o.outputs[0].text), per_design) for o in outputs]
+            
+        except Exception as e:
+            print(f"Error during batched generation: {e}")
+            return [(self._fallback_code(), time.time() - start_time)] * len(specifications)
+    
     def _construct_prompt(self, specification: str, template: str = "A") -> str:
         """Build prompt - same as Ollama interface"""
         return OllamaInterface._construct_prompt(self, specification, template)
@@ -410,7 +1023,8 @@ def create_model_interface(model_type: str, model_name: str):
     Factory function to create appropriate model interface
     
     Args:
-        model_type: 'ollama' or 'huggingface'
+        model_type: 'ollama', 'huggingface' or 'vllm' (falls back to
+                    'huggingface' when vllm is not installed)
         model_name: Model identifier
         
     Returns:
@@ -418,6 +1032,12 @@ def create_model_interface(model_type: str, model_name: str):
     """
     if model_type.lower() == "ollama":
         return OllamaInterface(model_name)
+    elif model_type.lower() == "vllm":
+        import importlib.util
+        if importlib.util.find_spec("vllm") is not None:
+            return VLLMInterface(model_name)
+        print("⚠ vllm not installed; using HuggingFace transformers backend")
+        return HuggingFaceInterface(model_name)
     elif model_type.lower() == "huggingface":
         return HuggingFaceInterface(model_name)
     else:
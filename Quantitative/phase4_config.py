@@ -11,6 +11,11 @@ class Phase4Config:
     MAX_ITERATIONS = 5
     ADAPTIVE_STOPPING = True
     MIN_IMPROVEMENT_THRESHOLD = 0.1  # Minimum improvement to continue
+    NO_IMPROVEMENT_WINDOW = 2  # Recent attempts checked for that improvement (2 = last two)
+    STOPPING_METHOD = "window"  # "window" (no improvement across the window) or "slope" (flat, trendless score regression)
+    SLOPE_WINDOW = 5  # Recent scores fitted by the "slope" method (at least 3)
+    SLOPE_R2_THRESHOLD = 0.36  # "slope" stops only when the fit explains less than this share of variance
+    SLOPE_EMA_DECAY = 0.9  # Smoothing of the slope estimate across attempts
     
     # Post-Processing Intelligence
     ENABLE_WAVEFORM_ANALYSIS = True
@@ -20,6 +25,10 @@ class Phase4Config:
     # Confidence Tracking
     CONFIDENCE_TRACKING = True
     CONFIDENCE_SAMPLES = 3  # Number of samples for entropy calculation
+    ENTROPY_METHOD = "edit"  # "edit" (edit distance), "jaccard" (4-gram shingles, faster) or "line" (streaming line agreement)
+    PARALLEL_CONFIDENCE_SAMPLES = True  # Draw samples concurrently for models with thread_safe = True
+    CONFIDENCE_MIN_SAMPLES = 2  # Generations (including the primary) drawn before early stop is considered
+    CONFIDENCE_EARLY_STOP_THRESHOLD = 0.1  # Stop sampling once the distinct-output fraction is below this (None = off)
     
     # Semantic Repair
     ENABLE_SEMANTIC_REPAIR = True
@@ -55,6 +64,12 @@ class Phase4Config:
     
     # Generation caching
     ENABLE_GENERATION_CACHE = True
+    GENERATION_CACHE_MAX_ENTRIES = 4096  # Per-evaluator LRU bound (least recently used entries evicted)
+    # Share generations for identical prompts across tasks/repetitions and
+    # persist them to <output_dir>/.prompt_cache.json for re-runs. Off by
+    # default: repetitions would otherwise replay the first generation.
+    SHARED_PROMPT_CACHE = False
+    PROMPT_CACHE_FILE = None  # Path of the persisted shared cache (None = <output_dir>/.prompt_cache.json)
     
     # Per-task wall-clock timeout (seconds) for a single (task, model, repetition)
     TASK_MAX_RUNTIME_SECONDS = 60
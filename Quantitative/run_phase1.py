@@ -13,11 +13,8 @@ from Eval_Pipeline import BenchmarkPipeline, EvaluationMetrics, HDLCompiler, HDL
 import time
 
 
-def get_few_shot_prompt(task_spec: str, module_name: str = None) -> str:
-    """Few-shot learning with examples"""
-    module_hint = f"\nCRITICAL: Module name must be exactly: {module_name}" if module_name else ""
-    
-    return f"""You are a Verilog HDL expert. Generate synthesizable Verilog-2001 code.
+# Static text around the specification in the few-shot prompt
+_FEW_SHOT_PREFIX = """You are a Verilog HDL expert. Generate synthesizable Verilog-2001 code.
 
 Here are examples of CORRECT Verilog modules:
 
@@ -42,8 +39,8 @@ module dff(input wire clk, input wire rst, input wire d, output reg q);
     end
 endmodule
 
-Now generate Verilog for: {task_spec}
-{module_hint}
+Now generate Verilog for: """
+_FEW_SHOT_SUFFIX = """
 
 RULES:
 - Start with 'module', end with 'endmodule'
@@ -56,6 +53,13 @@ Generate ONLY the module code:
 """
 
 
+def get_few_shot_prompt(task_spec: str, module_name: str = None) -> str:
+    """Few-shot learning with examples"""
+    module_hint = f"\nCRITICAL: Module name must be exactly: {module_name}" if module_name else ""
+    
+    return _FEW_SHOT_PREFIX + task_spec + "\n" + module_hint + _FEW_SHOT_SUFFIX
+
+
 def extract_module_name(task_id: str) -> str:
     """Extract expected module name from task ID (with special cases)."""
     name = task_id.replace("comb_", "").replace("seq_", "")
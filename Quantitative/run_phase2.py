@@ -9,6 +9,7 @@ import json
 import statistics
 from pathlib import Path
 from collections import defaultdict
+from functools import lru_cache
 sys.path.insert(0, str(Path(__file__).parent))
 
 from dataset_loader import load_tasks_from_json, print_dataset_stats, validate_dataset
@@ -21,6 +22,7 @@ REPETITIONS_PER_PROMPT = 3  # Run each prompt 3 times for statistical significan
 TEMPERATURE = 0.0  # Use 0.0 for deterministic results (or 0.3 for variation)
 
 
+@lru_cache(maxsize=1024)
 def extract_module_name(task_id: str) -> str:
     """Extract expected module name from task ID (with special cases)."""
     for prefix in ("comb_", "seq_", "fsm_", "mixed_"):
@@ -134,6 +136,13 @@ def get_port_spec(module_name: str) -> dict:
 
 def get_constrained_prompt(task_spec: str, module_name: str) -> str:
     """Phase 2: Constrained prompt with exact module/port names and comprehensive examples"""
+    prefix, suffix = _constrained_prompt_parts(module_name)
+    return prefix + task_spec + suffix
+
+
+@lru_cache(maxsize=256)
+def _constrained_prompt_parts(module_name: str) -> tuple:
+    """Static text before and after the specification for one module (built once)"""
     port_info = get_port_spec(module_name)
     
     # Add task-specific examples for all task types
@@ -615,9 +624,10 @@ STRUCTURE HINT for Combinational:
 - Use wire for all signals
 """
     
-    return f"""Generate ONLY synthesizable Verilog-2001 code. NO explanations, NO instructions, NO text outside module.
+    prefix = """Generate ONLY synthesizable Verilog-2001 code. NO explanations, NO instructions, NO text outside module.
 
-SPECIFICATION: {task_spec}
+SPECIFICATION: """
+    suffix = f"""
 {example}
 MANDATORY STRUCTURE - Use this EXACT format:
 module {module_name}(
@@ -650,8 +660,12 @@ CRITICAL RULES - MUST FOLLOW ALL:
 
 Generate ONLY the complete Verilog module code:
 """
+    return prefix, suffix
 
 
+# Pure in (code, module name); confidence samples and repeated attempts
+# often produce identical raw output, so the regex passes run once per string
+@lru_cache(maxsize=1024)
 def post_process_verilog(code: str, expected_module_name: str) -> str:
     """Phase 2: Enhanced post-processing with comprehensive syntax fixes"""
     port_info = get_port_spec(expected_module_name)
@@ -15,7 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from dataset_loader import load_tasks_from_json, print_dataset_stats, validate_dataset
 from model_interface import OllamaInterface, HuggingFaceInterface
-from Eval_Pipeline import BenchmarkPipeline, EvaluationMetrics, HDLCompiler, HDLSimulator
+from Eval_Pipeline import BenchmarkPipeline, EvaluationMetrics, GenerationCache, HDLCompiler, HDLSimulator
 from run_phase2 import extract_module_name, get_port_spec, post_process_verilog
 from phase5_config import Phase5Config
 from phase5_feedback import Phase5FeedbackGenerator
@@ -521,6 +521,7 @@ class Phase5IterativeEvaluator:
         waveform_analyzer: Optional[WaveformAnalyzer] = None,
         formal_verifier: Optional[FormalVerifier] = None,
         repair_engine: Phase5Repair = None,
+        prompt_cache: Optional[GenerationCache] = None,
     ):
         from iterative_evaluator import IterativeEvaluator
         
@@ -569,6 +570,7 @@ class Phase5IterativeEvaluator:
             feedback_generator=wrapper_feedback,
             waveform_analyzer=waveform_analyzer,
             formal_verifier=formal_verifier,
+            prompt_cache=prompt_cache,
         )
     
     def evaluate_with_refinement(
@@ -698,7 +700,7 @@ def main():
     simulator = HDLSimulator()
     
     waveform_analyzer = WaveformAnalyzer(config.ENABLE_WAVEFORM_ANALYSIS) if config.ENABLE_WAVEFORM_ANALYSIS else None
-    formal_verifier = FormalVerifier(config.ENABLE_FORMAL_VERIFICATION) if config.ENABLE_FORMAL_VERIFICATION else None
+    formal_verifier = FormalVerifier(config.ENABLE_FORMAL_VERIFICATION, persistent=True) if config.ENABLE_FORMAL_VERIFICATION else None
     ast_repair = ASTRepair(config.ENABLE_AST_REPAIR) if config.ENABLE_AST_REPAIR else None
     
     semantic_repair = SemanticRepair(
@@ -707,7 +709,7 @@ def main():
         enable_ast=config.ENABLE_AST_REPAIR
     ) if config.ENABLE_SEMANTIC_REPAIR else None
     
-    confidence_tracker = ConfidenceTracker(config.CONFIDENCE_SAMPLES) if config.CONFIDENCE_TRACKING else None
+    confidence_tracker = ConfidenceTracker(config.CONFIDENCE_SAMPLES, config.ENTROPY_METHOD) if config.CONFIDENCE_TRACKING else None
     feedback_generator = Phase5FeedbackGenerator(config.MAX_FEEDBACK_LENGTH)
     repair_engine = Phase5Repair()
     
@@ -718,6 +720,14 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
     print(f"\n📊 Saving to: {output_dir}")
     
+    # Generations shared across tasks/repetitions and persisted for re-runs
+    prompt_cache = None
+    # A common PROMPT_CACHE_FILE lets sweeps with different output dirs share generations
+    prompt_cache_file = Path(config.PROMPT_CACHE_FILE or output_dir / ".prompt_cache.json")
+    if config.SHARED_PROMPT_CACHE and config.ENABLE_GENERATION_CACHE:
+        prompt_cache = GenerationCache()
+        prompt_cache.load(prompt_cache_file)
+    
     pipeline = BenchmarkPipeline(output_dir)
     
     # Use full task list
@@ -786,6 +796,7 @@ def main():
                         waveform_analyzer=waveform_analyzer,
                         formal_verifier=formal_verifier,
                         repair_engine=repair_engine,
+                        prompt_cache=prompt_cache,
                     )
                     
                     # Run iterative evaluation
@@ -912,6 +923,8 @@ def main():
     with open(individual_results_file, 'w') as f:
         json.dump(all_results, f, indent=2)
     print(f"✓ Individual run results: {individual_results_file}")
+    if prompt_cache is not None and len(prompt_cache):
+        prompt_cache.save(prompt_cache_file)
     print(f"  Total runs: {len(all_results)} ({total_tasks} tasks × {len(models)} models × {REPETITIONS_PER_PROMPT} reps)")
     
     # Save task statistics
@@ -3,6 +3,7 @@ VCD Waveform Analysis Module
 Handles VCD file generation, parsing, and comparison for semantic repair
 """
 
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -29,6 +30,10 @@ except Exception:
 if not PYVCD_AVAILABLE:
     print("⚠ VCD parsing not available. Install with: pip install pyvcd")
 
+# Native VCD differ (cargo install vcddiff); optional
+VCDDIFF_PATH = shutil.which("vcddiff")
+VCDDIFF_AVAILABLE = VCDDIFF_PATH is not None
+
 
 class WaveformAnalyzer:
     """Analyzes VCD waveforms to identify logic mismatches"""
@@ -310,3 +315,88 @@ class WaveformAnalyzer:
             print(f"Error injecting VCD dump: {e}")
             return False
 
+
+
+class WaveformComparator:
+    """Compares VCD files with the external vcddiff tool
+    
+    vcddiff streams both dumps natively and reports the first divergence per
+    signal, so comparing large VCDs costs O(signals) memory instead of loading
+    every value change into Python.
+    """
+    
+    def __init__(self, timeout: int = 60):
+        self.timeout = timeout
+        self.available = VCDDIFF_AVAILABLE
+    
+    @staticmethod
+    def signals_from_testbench(tb_path: Path) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Hierarchical clock and reset names as dumped from a testbench
+        
+        Args:
+            tb_path: Testbench whose first module is the VCD top scope
+            
+        Returns:
+            Tuple of ("<tb_top>.<clk>", "<tb_top>.<reset>"), with None for a
+            signal the testbench does not declare (e.g. combinational designs)
+        """
+        try:
+            text = tb_path.read_text()
+        except OSError:
+            return None, None
+        top = re.search(r'^\s*module\s+(\w+)', text, re.MULTILINE)
+        if top is None:
+            return None, None
+        
+        def declared(names: Tuple[str, ...]) -> Optional[str]:
+            for name in names:
+                if re.search(rf'\b(?:reg|wire|logic)\b[^;]*\b{name}\b', text):
+                    return f"{top.group(1)}.{name}"
+            return None
+        
+        return declared(("clk", "clock")), declared(("rst", "reset", "rst_n", "reset_n"))
+    
+    def compare(
+        self,
+        ref_vcd: Path,
+        dut_vcd: Path,
+        clock: Optional[str] = None,
+        reset: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Diff two VCD files
+        
+        Args:
+            ref_vcd: Reference waveform
+            dut_vcd: Waveform of the design under test
+            clock: Hierarchical clock signal used for cycle alignment
+                   (omitted from the vcddiff call when None)
+            reset: Hierarchical reset signal (omitted when None)
+            
+        Returns:
+            vcddiff report ("" when the waveforms match), or None if vcddiff
+            is unavailable or did not exit cleanly
+        """
+        if not self.available:
+            return None
+        
+        cmd = [VCDDIFF_PATH, "--vcd1", str(ref_vcd), "--vcd2", str(dut_vcd)]
+        if clock:
+            cmd += ["--clock", clock]
+        if reset:
+            cmd += ["--reset", reset]
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        
+        # Anything printed on a failed run is an error message, not a diff
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip()